@@ -3,7 +3,12 @@
 # Author: Dean Rumsby
 
 
+import argparse
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 ################################################################################
 ## Solutions
@@ -52,16 +57,14 @@ import re
 #
 # Consider your entire calibration document. What is the sum of all of the calibration values?
 #
-def part1() -> int:
-    with open("input.txt", "r") as file:
-        lines = file.read().splitlines()
-
+def part1(document: bytes) -> int:
     total = 0
-    pattern = re.compile(r"\d")
 
-    for line in lines:
-        digits = pattern.findall(line)
-        calibration_value = int(f"{digits[0]}{digits[-1]}")
+    for line in document.splitlines():
+        # stripping every non-digit from both ends leaves the first and last
+        # digits at either end of the line
+        digits = line.strip(NON_DIGITS)
+        calibration_value = 10 * (digits[0] - ZERO) + digits[-1] - ZERO
         total += calibration_value
 
     return total
@@ -89,17 +92,11 @@ def part1() -> int:
 #
 # What is the sum of all of the calibration values?
 #
-def part2():
-    with open("input.txt", "r") as file:
-        lines = file.read().splitlines()
-
+def part2(document: bytes) -> int:
     total = 0
-    pattern = re.compile(r"(?=(\d|one|two|three|four|five|six|seven|eight|nine))")
 
-    for line in lines:
-        mixed_digits = pattern.findall(line)
-        digits = [convert_spelled_digit(md) for md in mixed_digits]
-        calibration_value = int(f"{digits[0]}{digits[-1]}")
+    for line in document.splitlines():
+        calibration_value = 10 * first_digit(line) + last_digit(line)
         total += calibration_value
 
     return total
@@ -110,24 +107,123 @@ def part2():
 ################################################################################
 
 
-def convert_spelled_digit(s):
-    map = {
-        "one": "1",
-        "two": "2",
-        "three": "3",
-        "four": "4",
-        "five": "5",
-        "six": "6",
-        "seven": "7",
-        "eight": "8",
-        "nine": "9",
-    }
-    return map[s] if map.get(s) else s
+def parse(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+ZERO = ord("0")
+NON_DIGITS = bytes(b for b in range(256) if not ord("0") <= b <= ord("9"))
+
+SPELLED_DIGITS = {
+    b"one": 1,
+    b"two": 2,
+    b"three": 3,
+    b"four": 4,
+    b"five": 5,
+    b"six": 6,
+    b"seven": 7,
+    b"eight": 8,
+    b"nine": 9,
+}
+DIGIT_VALUES = {
+    **{str(d).encode(): d for d in range(10)},
+    **SPELLED_DIGITS,
+    **{word[::-1]: d for word, d in SPELLED_DIGITS.items()},
+}
+
+# The leftmost match of a forward scan is the first digit. Scanning the
+# reversed line for the reversed words finds the last digit the same way, and
+# both scans stop as soon as they match, so overlaps like "twone" are no issue.
+FIRST_DIGIT = re.compile(b"|".join([rb"\d", *SPELLED_DIGITS]))
+LAST_DIGIT = re.compile(b"|".join([rb"\d", *(word[::-1] for word in SPELLED_DIGITS)]))
+
+
+def first_digit(line: bytes) -> int:
+    return DIGIT_VALUES[FIRST_DIGIT.search(line).group()]
+
+
+def last_digit(line: bytes) -> int:
+    return DIGIT_VALUES[LAST_DIGIT.search(line[::-1]).group()]
+
+
+################################################################################
+## Parallel mode
+################################################################################
+
+
+def parallel_sum(document_sum, path="input.txt", workers=None, chunk_size=1 << 24):
+    """Sum a calibration document across a pool of processes.
+
+    The memory-mapped file is cut into chunks of roughly chunk_size bytes that
+    end on a newline, each worker sums its own chunk with document_sum
+    (part1 or part2), and the partial totals are added up at the end.
+    """
+    # an empty file can't be mapped, and has nothing to sum anyway
+    if os.path.getsize(path) == 0:
+        return 0
+
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as document:
+            starts, stops = [], []
+            start = 0
+            while start < len(document):
+                stop = document.find(b"\n", start + chunk_size) + 1 or len(document)
+                starts.append(start)
+                stops.append(stop)
+                start = stop
+
+    with ProcessPoolExecutor(workers) as executor:
+        totals = executor.map(
+            sum_chunk, repeat(document_sum), repeat(path), starts, stops
+        )
+        return sum(totals)
+
+
+def sum_chunk(document_sum, path, start, stop) -> int:
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as document:
+            return document_sum(document[start:stop])
+
+
+################################################################################
+## Streaming mode
+################################################################################
+
+
+def stream(lines) -> tuple[int, int]:
+    """Solve both parts from any iterable of lines, holding one line at a time."""
+    total1 = 0
+    total2 = 0
+
+    for line in lines:
+        line = (line.encode() if isinstance(line, str) else line).strip()
+        if not line:
+            continue
+
+        digits = line.strip(NON_DIGITS)
+        total1 += 10 * (digits[0] - ZERO) + digits[-1] - ZERO
+        total2 += 10 * first_digit(line) + last_digit(line)
+
+    return total1, total2
 
 
 ################################################################################
 ## Answers
 ################################################################################
 
-print(f"Part 1: The sum of all the calibration values is {part1()}")
-print(f"Part 2: The sum of all the new calibration values is {part2()}")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, help="sum the input in parallel")
+    parser.add_argument("--chunk-size", type=int, default=1 << 24)
+    args = parser.parse_args()
+
+    if args.workers:
+        answer1 = parallel_sum(part1, "input.txt", args.workers, args.chunk_size)
+        answer2 = parallel_sum(part2, "input.txt", args.workers, args.chunk_size)
+    else:
+        document = parse("input.txt")
+        answer1, answer2 = part1(document), part2(document)
+
+    print(f"Part 1: The sum of all the calibration values is {answer1}")
+    print(f"Part 2: The sum of all the new calibration values is {answer2}")
@@ -0,0 +1,44 @@
+import random
+
+from aoc.runner import load_day
+
+# loaded through the runner, which registers the module so that parallel_sum
+# can pickle its functions into the worker processes
+day1 = load_day(2023, 1)
+
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def random_document(rng, line_count):
+    lines = []
+    for _ in range(line_count):
+        pieces = rng.choices(WORDS + list("123456789abcxyz"), k=rng.randint(1, 8))
+        pieces.insert(rng.randrange(len(pieces) + 1), rng.choice("123456789"))
+        lines.append("".join(pieces))
+    return "".join(line + "\n" for line in lines)
+
+
+def test_example():
+    document = b"two1nine\neightwothree\nabcone2threexyz\nxtwone3four\n"
+    document += b"4nineeightseven2\nzoneight234\n7pqrstsixteen\n"
+    assert day1.part2(document) == 281
+    assert day1.part1(b"1abc2\npqr3stu8vwx\na1b2c3d4e5f\ntreb7uchet\n") == 142
+
+
+def test_parallel_sum_matches_serial(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(random_document(random.Random(1), 200))
+    document = day1.parse(path)
+
+    for chunk_size in [1, 7, 100, 1 << 20]:
+        for document_sum in [day1.part1, day1.part2]:
+            assert day1.parallel_sum(
+                document_sum, path, workers=2, chunk_size=chunk_size
+            ) == document_sum(document)
+
+
+def test_parallel_sum_of_empty_document(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+    assert day1.parallel_sum(day1.part1, path, workers=2) == 0
+    assert day1.part1(day1.parse(path)) == 0
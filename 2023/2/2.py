@@ -2,7 +2,7 @@
 # Day 2: Cubes in the Bag
 # Author: Dean Rumsby
 
-import re
+import numpy as np
 
 ################################################################################
 ## Solutions
@@ -62,19 +62,11 @@ import re
 #
 # What is the sum of the IDs of those games?
 #
-def part1() -> int:
-    with open("input.txt", "r") as file:
-        games = file.read().splitlines()
-
+def part1(games: list[tuple[int, int, int, int]]) -> int:
     id_sum = 0
 
-    for game in games:
-        id = int(re.findall(r"(?<=Game )\d+", game)[0])
-        blues = (int(n) for n in re.findall(r"\d+(?= blue)", game))
-        reds = (int(n) for n in re.findall(r"\d+(?= red)", game))
-        greens = (int(n) for n in re.findall(r"\d+(?= green)", game))
-
-        if max(reds) <= 12 and max(greens) <= 13 and max(blues) <= 14:
+    for id, max_red, max_green, max_blue in games:
+        if max_red <= 12 and max_green <= 13 and max_blue <= 14:
             id_sum += id
 
     return id_sum
@@ -115,26 +107,100 @@ def part1() -> int:
 # For each game, find the minimum set of cubes that must have been present.
 # What is the sum of the power of these sets?
 #
-def part2() -> int:
-    with open("input.txt", "r") as file:
-        games = file.read().splitlines()
-
+def part2(games: list[tuple[int, int, int, int]]) -> int:
     power_sum = 0
 
-    for game in games:
-        blues = (int(n) for n in re.findall(r"\d+(?= blue)", game))
-        reds = (int(n) for n in re.findall(r"\d+(?= red)", game))
-        greens = (int(n) for n in re.findall(r"\d+(?= green)", game))
-
-        power = max(blues) * max(reds) * max(greens)
+    for _, max_red, max_green, max_blue in games:
+        power = max_red * max_green * max_blue
         power_sum += power
 
     return power_sum
 
 
+################################################################################
+## Global functions
+################################################################################
+
+
+# Both parts only ever need the largest count of each colour in a game, so
+# every game is tokenized once into an (id, max_red, max_green, max_blue) record
+def parse(path: str) -> list[tuple[int, int, int, int]]:
+    with open(path, "r") as file:
+        return [parse_game(line) for line in file.read().splitlines()]
+
+
+def parse_game(line: str) -> tuple[int, int, int, int]:
+    header, reveals = line.split(":")
+    maxima = {"r": 0, "g": 0, "b": 0}
+
+    # after dropping the separators the reveals alternate count, colour
+    tokens = reveals.replace(",", " ").replace(";", " ").split()
+    for count, colour in zip(tokens[::2], tokens[1::2]):
+        count = int(count)
+        if count > maxima[colour[0]]:
+            maxima[colour[0]] = count
+
+    return int(header[5:]), maxima["r"], maxima["g"], maxima["b"]
+
+
+class GameIndex:
+    """Per-game colour maxima stored as columns for bulk bag queries.
+
+    A bag of (red, green, blue) cubes makes a game possible when it holds at
+    least that game's maximum of each colour, so a whole batch of candidate
+    bags can be checked against every game with one broadcast comparison.
+    """
+
+    def __init__(self, games: list[tuple[int, int, int, int]]):
+        columns = np.array(games, np.int64).reshape(-1, 4)
+        self.ids = columns[:, 0]
+        self.maxima = columns[:, 1:]
+
+    def possible(self, bags) -> np.ndarray:
+        """Return a (bags, games) boolean matrix of which games each bag allows."""
+        bags = np.asarray(bags, np.int64).reshape(-1, 3)
+        return (self.maxima[np.newaxis, :, :] <= bags[:, np.newaxis, :]).all(axis=2)
+
+    def possible_id_sums(self, bags, chunk_size=1024) -> np.ndarray:
+        bags = np.asarray(bags, np.int64).reshape(-1, 3)
+        # bags are checked a chunk at a time to bound the size of the matrix
+        return np.concatenate(
+            [
+                self.possible(bags[i : i + chunk_size]) @ self.ids
+                for i in range(0, len(bags), chunk_size)
+            ]
+            or [np.zeros(0, np.int64)]
+        )
+
+    def possible_ids(self, bags) -> list[np.ndarray]:
+        return [self.ids[row] for row in self.possible(bags)]
+
+
+################################################################################
+## Streaming mode
+################################################################################
+
+
+def stream(lines) -> tuple[int, int]:
+    """Solve both parts from any iterable of lines, holding one game at a time."""
+    id_sum = 0
+    power_sum = 0
+
+    for line in lines:
+        if line.strip():
+            game = [parse_game(line)]
+            id_sum += part1(game)
+            power_sum += part2(game)
+
+    return id_sum, power_sum
+
+
 ################################################################################
 ## Answers
 ################################################################################
 
-print(f"Part 1: The sum of the IDs of all possible games is {part1()}")
-print(f"Part 2: The sum of the powers of the minimal sets is {part2()}")
+if __name__ == "__main__":
+    games = parse("input.txt")
+
+    print(f"Part 1: The sum of the IDs of all possible games is {part1(games)}")
+    print(f"Part 2: The sum of the powers of the minimal sets is {part2(games)}")
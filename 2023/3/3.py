@@ -1,53 +1,139 @@
 import re
+import sys
+from bisect import bisect_left, bisect_right
+from collections import deque
+from pathlib import Path
 
-with open("input.txt", "r") as file:
-    lines = file.read().splitlines()
+import numpy as np
 
 
-def find_adjacent_matches(pattern, location):
-    i, (start_j, end_j) = location
-    adjacent_span = set(range(start_j - 1, end_j + 1))
+def stream(lines) -> tuple[int, int]:
+    """Solve both parts from any iterable of lines, holding three rows at a time."""
+    part_numbers_sum = 0
+    gear_ratios_sum = 0
 
-    is_out_of_bounds = lambda i: i < 0 or i >= len(lines)
-    is_adjacent = lambda m: not adjacent_span.isdisjoint(set(range(m.start(), m.end())))
+    for row_part_numbers, row_gear_ratios in stream_schematic(lines):
+        part_numbers_sum += row_part_numbers
+        gear_ratios_sum += row_gear_ratios
 
-    adjacent_matches = []
+    return part_numbers_sum, gear_ratios_sum
 
-    for di in [-1, 0, 1]:
-        i_bar = i + di
 
-        if is_out_of_bounds(i_bar):
-            continue
+if __name__ == "__main__":
+    # run as a script, the aoc package isn't importable from this directory
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-        matches = re.finditer(pattern, lines[i_bar])
-        adjacent_matches.extend(list(filter(is_adjacent, matches)))
+from aoc.grid import Grid, dilate, gather_labels, label_runs, neighbourhoods, run_values
 
-    return adjacent_matches
 
+class Row:
+    """The numbers and symbols of a single schematic line.
 
-part_numbers_sum = 0
-gear_ratio_sum = 0
+    Numbers are kept as sorted spans [starts[k], ends[k]) with their values,
+    and symbols / gears as sorted column lists, so adjacency can be answered
+    with bisects instead of rescanning the line.
+    """
 
-for i, line in enumerate(lines):
-    numbers = re.finditer(r"\d+", line)
-    potential_gears = re.finditer(r"\*", line)
+    def __init__(self, line: str):
+        # lines read from a file keep their endings, which aren't symbols
+        line = line.rstrip("\r\n")
 
-    for number in numbers:
-        adjacent_symbols = find_adjacent_matches(r"[^\.\d]", (i, number.span()))
+        self.starts = []
+        self.ends = []
+        self.values = []
+        for number in re.finditer(r"\d+", line):
+            self.starts.append(number.start())
+            self.ends.append(number.end())
+            self.values.append(int(number.group()))
 
-        if adjacent_symbols:
-            part_numbers_sum += int(number.group())
+        self.symbols = []
+        self.gears = []
+        for symbol in re.finditer(r"[^\.\d]", line):
+            self.symbols.append(symbol.start())
+            if symbol.group() == "*":
+                self.gears.append(symbol.start())
 
-    for pg in potential_gears:
-        adjacent_numbers = find_adjacent_matches(r"\d+", (i, pg.span()))
+    def has_symbol_between(self, start, end):
+        # any symbol in columns [start, end)
+        return bisect_left(self.symbols, start) < bisect_left(self.symbols, end)
 
+    def numbers_touching(self, column):
+        # spans don't overlap, so both starts and ends are sorted and the
+        # numbers touching columns column - 1 to column + 1 are a contiguous run
+        lo = bisect_right(self.ends, column - 1)
+        hi = bisect_right(self.starts, column + 1)
+        return self.values[lo:hi]
+
+
+def parse(path) -> Grid:
+    return Grid.load(path)
+
+
+def part1(grid: Grid) -> int:
+    labels, count = label_runs(grid.digits())
+    values = run_values(grid, labels, count)
+    return int(values[gather_labels(labels, dilate(grid.symbols()))].sum())
+
+
+def part2(grid: Grid) -> int:
+    labels, count = label_runs(grid.digits())
+    values = run_values(grid, labels, count)
+
+    # the distinct numbers around each gear are the distinct non-zero labels
+    # in its neighbourhood
+    around = np.sort(neighbourhoods(labels, grid.mask("*")), axis=1)
+    distinct = (around > 0) & (np.diff(around, axis=1, prepend=0) != 0)
+    is_gear = distinct.sum(axis=1) == 2
+
+    ratios = np.where(distinct, values[around], 1).prod(axis=1)
+    return int(ratios[is_gear].sum())
+
+
+def row_part_numbers_sum(row, neighbours):
+    total = 0
+    for start, end, value in zip(row.starts, row.ends, row.values):
+        if any(r.has_symbol_between(start - 1, end + 1) for r in neighbours):
+            total += value
+    return total
+
+
+def row_gear_ratio_sum(row, neighbours):
+    total = 0
+    for column in row.gears:
+        adjacent_numbers = [
+            value for r in neighbours for value in r.numbers_touching(column)
+        ]
         if len(adjacent_numbers) == 2:
-            gear_ratio = 1
-            for an in adjacent_numbers:
-                gear_ratio *= int(an.group())
+            total += adjacent_numbers[0] * adjacent_numbers[1]
+    return total
+
+
+def row_sums(row, neighbours):
+    return row_part_numbers_sum(row, neighbours), row_gear_ratio_sum(row, neighbours)
+
+
+def stream_schematic(lines):
+    """Yield each row's (part numbers sum, gear ratio sum) from an iterable of lines.
+
+    Adjacency never looks further than one row away, so only a window of three
+    parsed rows is held at a time and the schematic never has to fit in memory.
+    """
+    window = deque(maxlen=3)
+
+    for line in lines:
+        window.append(Row(line))
+        # the row in the middle of the window now has both of its neighbours
+        # (or is the first row, which has nothing above it)
+        if len(window) > 1:
+            yield row_sums(window[-2], window)
+
+    # the last row has nothing below it
+    if window:
+        yield row_sums(window[-1], list(window)[-2:])
 
-            gear_ratio_sum += gear_ratio
 
+if __name__ == "__main__":
+    grid = parse("input.txt")
 
-print(f"Part 1: The sum of all the part numbers is {part_numbers_sum}")
-print(f"Part 2: The sum of all the gear ratios is {gear_ratio_sum}")
+    print(f"Part 1: The sum of all the part numbers is {part1(grid)}")
+    print(f"Part 2: The sum of all the gear ratios is {part2(grid)}")
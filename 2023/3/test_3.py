@@ -0,0 +1,49 @@
+import importlib.util
+import io
+import random
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location("day3", Path(__file__).with_name("3.py"))
+day3 = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(day3)
+
+EXAMPLE = [
+    "467..114..",
+    "...*......",
+    "..35..633.",
+    "......#...",
+    "617*......",
+    ".....+.58.",
+    "..592.....",
+    "......755.",
+    "...$.*....",
+    ".664.598..",
+]
+
+
+def random_schematic(rng, height, width):
+    return [
+        "".join(rng.choice("..........0123456789*#+$") for _ in range(width))
+        for _ in range(height)
+    ]
+
+
+def test_example():
+    grid = day3.Grid.from_lines(EXAMPLE)
+    assert day3.part1(grid) == 4361
+    assert day3.part2(grid) == 467835
+    assert day3.stream(EXAMPLE) == (4361, 467835)
+
+
+def test_stream_matches_grid():
+    rng = random.Random(3)
+    for _ in range(300):
+        lines = random_schematic(rng, rng.randint(1, 8), rng.randint(1, 12))
+        grid = day3.Grid.from_lines(lines)
+        expected = day3.part1(grid), day3.part2(grid)
+
+        assert day3.stream(lines) == expected
+        # lines read from a file keep their endings
+        assert day3.stream(io.StringIO("".join(line + "\n" for line in lines))) == (
+            expected
+        )
@@ -1,32 +1,177 @@
-with open("input.txt", "r") as file:
-    cards = file.read().splitlines()
+import numpy as np
 
+SPACE, COLON, BAR, ZERO = b" :|0"
 
-total_points = 0
 
-card_counts = {id: 1 for id in range(len(cards))}
-total_cards = 0
+def mask(numbers):
+    # the numbers on a card are small, so a set of them fits in a single int
+    bits = 0
+    for number in numbers:
+        bits |= 1 << int(number)
+    return bits
 
-for id, card in enumerate(cards):
-    player_numbers, winning_numbers = [
-        [int(char) for char in s.split()] for s in card[9:].split("|")
-    ]
 
-    # Part 1
-    winning = 0
-    for pn in player_numbers:
-        if pn in winning_numbers:
-            winning += 1
+def count_winning(card):
+    player_numbers, winning_numbers = card[card.index(":") + 1 :].split("|")
+    return (mask(player_numbers.split()) & mask(winning_numbers.split())).bit_count()
 
-    total_points += 2 ** (winning - 1) if winning else 0
 
-    # Part 2
-    for _ in range(card_counts[id]):
-        for i in range(1, winning + 1):
-            card_counts[id + i] += 1
+def count_winnings(document: bytes, chunk_size=1 << 16) -> np.ndarray:
+    """Count the winning numbers of every card in a document at once.
 
-    total_cards += card_counts[id]
+    Consecutive cards of the same length have their numbers in the same
+    columns, so each run of them is viewed as a 2-D array of bytes, every
+    number is read straight from its two columns and the sets of numbers
+    become a 128-bit mask a card, which are ANDed and popcounted. Runs that
+    aren't laid out in fixed columns of right aligned two digit numbers are
+    counted a card at a time.
+    """
+    if not document.endswith(b"\n"):
+        document += b"\n"
+    text = np.frombuffer(document, dtype=np.uint8)
+    ends = np.flatnonzero(text == ord("\n"))
+    starts = np.concatenate(([0], ends[:-1] + 1))
 
+    # blank lines aren't cards
+    starts, ends = starts[ends > starts], ends[ends > starts]
+    lengths = ends - starts
+    breaks = (lengths[1:] != lengths[:-1]) | (starts[1:] != ends[:-1] + 1)
+    runs = np.concatenate(([0], np.flatnonzero(breaks) + 1, [len(starts)]))
 
-print(f"Part 1: The scratchcards are worth {total_points} points in total")
-print(f"Part 2: We end up with {total_cards} scratchcards in total")
+    winnings = np.zeros(len(starts), dtype=np.int64)
+    for first, last in zip(runs[:-1], runs[1:]):
+        for lo in range(first, last, chunk_size):
+            hi = min(lo + chunk_size, last)
+            width = lengths[lo] + 1
+            cards = text[starts[lo] : starts[lo] + (hi - lo) * width]
+            winnings[lo:hi] = count_block(cards.reshape(hi - lo, width)[:, :-1])
+
+    return winnings
+
+
+def count_block(cards: np.ndarray) -> np.ndarray:
+    colon = bytes(cards[0]).find(b":")
+    bar = bytes(cards[0]).find(b"|")
+    width = cards.shape[1]
+
+    # each number takes three columns, a space and then two right aligned
+    # digits, with one more space before the bar
+    if 0 <= colon < bar and (bar - colon - 2) % 3 == 0 and (width - bar - 1) % 3 == 0:
+        winning = np.arange(colon + 1, bar - 1, 3)
+        player = np.arange(bar + 1, width, 3)
+        fields = np.concatenate((winning, player))
+
+        # the low four bits of both a digit and a space are the value of that
+        # digit (with a space as 0), and anything below "0" wraps around
+        tens = cards[:, fields + 1]
+        units = cards[:, fields + 2] - ZERO
+        if (
+            (cards[:, colon] == COLON).all()
+            and (cards[:, bar] == BAR).all()
+            and (cards[:, fields] == SPACE).all()
+            and (cards[:, bar - 1] == SPACE).all()
+            and (units < 10).all()
+            and ((tens - ZERO < 10) | (tens == SPACE)).all()
+        ):
+            numbers = (tens & 15) * 10 + units
+            winning_masks = number_masks(numbers[:, : len(winning)])
+            player_masks = number_masks(numbers[:, len(winning) :])
+            return np.bitwise_count(player_masks & winning_masks).sum(axis=1)
+
+    return np.array([count_winning(bytes(card).decode()) for card in cards])
+
+
+def number_masks(numbers: np.ndarray) -> np.ndarray:
+    # every number is below 128, so each card's set fits in two 64-bit words
+    bits = np.zeros((len(numbers), 128), dtype=bool)
+    bits[np.arange(len(numbers))[:, None], numbers] = True
+    return np.packbits(bits, axis=1).view(np.uint64)
+
+
+def parse(path) -> list[int]:
+    with open(path, "rb") as file:
+        return count_winnings(file.read()).tolist()
+
+
+def part1(winnings) -> int:
+    return sum(2 ** (winning - 1) for winning in winnings if winning)
+
+
+def part2(winnings) -> int:
+    return count_cards(winnings)
+
+
+class Cascade:
+    """Hands out the copies won by each card as the cards arrive in order.
+
+    Each copy of a card adds one copy to each of the next `winning` cards, so
+    rather than handing them out one at a time we record where the extra
+    copies stop and keep a running sum. A card can't win past the next
+    `winning` cards, so the stopping points still ahead fit in a ring buffer
+    of any size larger than the most matches seen so far. The ring starts with
+    `size` slots and, should a card win as many matches as that, grows to
+    twice its matches, so it stays within a small multiple of the number of
+    winning numbers on a card. How many cards are coming needn't be known.
+    """
+
+    def __init__(self, size=16):
+        self.id = 0
+        self.extra_copies = 0
+        self.copies_ending = [0] * size
+        self.total_cards = 0
+
+    def add(self, winning: int) -> int:
+        """Add the next card and return how many copies of it we end up with."""
+        if winning >= len(self.copies_ending):
+            self.resize(2 * winning)
+
+        ring = self.copies_ending
+        slot = self.id % len(ring)
+        self.extra_copies -= ring[slot]
+        ring[slot] = 0
+
+        card_count = 1 + self.extra_copies
+        self.total_cards += card_count
+
+        if winning:
+            self.extra_copies += card_count
+            ring[(self.id + winning + 1) % len(ring)] += card_count
+
+        self.id += 1
+        return card_count
+
+    def resize(self, size: int):
+        # the slot for card id + k moves from (id + k) % old to (id + k) % size
+        ring = [0] * size
+        old = self.copies_ending
+        for id in range(self.id, self.id + len(old)):
+            ring[id % size] = old[id % len(old)]
+        self.copies_ending = ring
+
+
+def count_cards(winnings):
+    cascade = Cascade()
+    for winning in winnings:
+        cascade.add(winning)
+    return cascade.total_cards
+
+
+def stream(lines) -> tuple[int, int]:
+    """Solve both parts from any iterable of lines, holding one card at a time."""
+    total_points = 0
+    cascade = Cascade()
+
+    for line in lines:
+        if line.strip():
+            winning = count_winning(line)
+            total_points += 2 ** (winning - 1) if winning else 0
+            cascade.add(winning)
+
+    return total_points, cascade.total_cards
+
+
+if __name__ == "__main__":
+    winnings = parse("input.txt")
+
+    print(f"Part 1: The scratchcards are worth {part1(winnings)} points in total")
+    print(f"Part 2: We end up with {part2(winnings)} scratchcards in total")
@@ -0,0 +1,55 @@
+import importlib.util
+import time
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location("day4", Path(__file__).with_name("4.py"))
+day4 = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(day4)
+
+
+def count_cards_naive(winnings):
+    # the original cascade, which hands out every won copy one at a time
+    card_counts = {id: 1 for id in range(len(winnings))}
+    total_cards = 0
+
+    for id, winning in enumerate(winnings):
+        for _ in range(card_counts[id]):
+            for i in range(1, winning + 1):
+                card_counts[id + i] += 1
+
+        total_cards += card_counts[id]
+
+    return total_cards
+
+
+def deep_cascade(card_count, max_winning=10):
+    """Generate scratchcards where every card wins as many cards as it can."""
+    cards = []
+    for id in range(card_count):
+        winning = min(max_winning, card_count - id - 1)
+        winning_numbers = list(range(1, max_winning + 1))
+        player_numbers = winning_numbers[:winning] + [99] * (max_winning - winning)
+        cards.append(
+            f"Card {id + 1}: {' '.join(map(str, winning_numbers))} | "
+            f"{' '.join(map(str, player_numbers))}"
+        )
+    return cards
+
+
+def measure(count_cards, winnings):
+    start = time.perf_counter()
+    total_cards = count_cards(winnings)
+    return total_cards, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'cards':>6} {'total cards':>14} {'naive (s)':>10} {'diff (s)':>10}")
+
+    for card_count in [10, 14, 18, 20, 22]:
+        winnings = [day4.count_winning(card) for card in deep_cascade(card_count)]
+
+        naive_total, naive_time = measure(count_cards_naive, winnings)
+        total, diff_time = measure(day4.count_cards, winnings)
+        assert naive_total == total
+
+        print(f"{card_count:>6} {total:>14} {naive_time:>10.4f} {diff_time:>10.6f}")
@@ -0,0 +1,91 @@
+import importlib.util
+import random
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location("day4", Path(__file__).with_name("4.py"))
+day4 = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(day4)
+
+
+def aligned_card(rng, id, winning, player):
+    numbers = rng.sample(range(1, 100), winning + player)
+    matches = rng.randint(0, min(winning, player))
+    player_numbers = numbers[:matches] + numbers[winning : winning + player - matches]
+    rng.shuffle(player_numbers)
+
+    join = lambda ns: " ".join(f"{n:>2}" for n in ns)
+    return f"Card {id:>3}: {join(numbers[:winning])} | {join(player_numbers)}"
+
+
+def unaligned_card(rng, id):
+    numbers = rng.sample(range(1, 100), rng.randint(1, 8))
+    winning_numbers = numbers[: rng.randint(0, len(numbers))]
+    player_numbers = rng.sample(numbers, rng.randint(1, len(numbers)))
+
+    # one or more spaces between numbers, and maybe some on the end
+    join = lambda ns: "".join(" " * rng.randint(1, 3) + str(n) for n in ns)
+    card = f"Card {id}:{join(winning_numbers)} |{join(player_numbers)}"
+    return card + " " * rng.randint(0, 2)
+
+
+def check(cards):
+    document = "".join(card + "\n" for card in cards).encode()
+    expected = [day4.count_winning(card) for card in cards]
+    assert day4.count_winnings(document).tolist() == expected
+    assert day4.count_winnings(document, chunk_size=3).tolist() == expected
+    assert day4.count_winnings(document.rstrip(b"\n")).tolist() == expected
+
+
+def test_well_formed_decks(monkeypatch):
+    rng = random.Random(4)
+    decks = []
+    for _ in range(200):
+        # every card in a real deck has as many numbers as the others
+        winning, player = rng.randint(1, 10), rng.randint(1, 25)
+        cards = [
+            aligned_card(rng, id, winning, player)
+            for id in range(1, rng.randint(2, 30))
+        ]
+        check(cards)
+        decks.append(cards)
+
+    # and they are all counted in bulk, never a card at a time
+    monkeypatch.setattr(day4, "count_winning", None)
+    for cards in decks:
+        day4.count_winnings("\n".join(cards).encode())
+
+
+def test_badly_formed_decks():
+    rng = random.Random(5)
+    for _ in range(500):
+        winning, player = rng.randint(1, 10), rng.randint(1, 25)
+        check(
+            [
+                (
+                    aligned_card(rng, id, winning, player)
+                    if rng.random() < 0.5
+                    else unaligned_card(rng, id)
+                )
+                for id in range(1, rng.randint(2, 20))
+            ]
+        )
+
+
+def test_misaligned_numbers():
+    for card in ["Card 1: 4 | 40", "Card 1: 41 5 | 50 41", "Card 1: 41 48 | 83 86 "]:
+        check([card])
+
+
+def test_example():
+    cards = [
+        "Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53",
+        "Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19",
+        "Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1",
+        "Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83",
+        "Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36",
+        "Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11",
+    ]
+    winnings = day4.count_winnings("\n".join(cards).encode()).tolist()
+    assert winnings == [4, 2, 2, 1, 0, 0]
+    assert day4.part1(winnings) == 13
+    assert day4.part2(winnings) == 30
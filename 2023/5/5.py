@@ -1,130 +1,221 @@
+import json
+from bisect import bisect_right
+from functools import reduce
+
+import numpy as np
+
+
 class Range:
+    __slots__ = ("start", "end", "length")
+
     def __init__(self, start, length):
         self.start = start
         self.end = start + length - 1
         self.length = length
 
-    def includes(self, r: "Range"):
-        return self.start <= r.start and self.end >= r.end
 
-    def partition(self, points: list[int]):
-        parts = []
-        current = self
-        for point in sorted(points):
-            if point <= current.start or point > current.end:
-                continue
-            parts.append(Range(current.start, point - current.start))
-            current = Range(point, current.end - point + 1)
-        parts.append(current)
-        return parts
+def coalesce(ranges: list[Range]):
+    """Sort ranges and merge any that overlap or touch."""
+    merged = []
+    for r in sorted(ranges, key=lambda r: r.start):
+        if merged and r.start <= merged[-1].end + 1:
+            last = merged[-1]
+            if r.end > last.end:
+                merged[-1] = Range(last.start, r.end - last.start + 1)
+        else:
+            merged.append(r)
+    return merged
 
 
 class Map:
-    def __init__(self, domain: list[Range], image: list[Range]):
-        self.domain = domain
-        self.image = image
+    """A piecewise shift of the integers.
 
-    def map(self, ranges: list[Range]):
-        outputs = []
-        for r in ranges:
-            outputs.extend(self.__map(r))
-        return outputs
-
-    def __map(self, range_: Range):
-        partition_points = []
-        outputs = []
+    The map is stored as sorted, non-overlapping pieces in three parallel
+    lists: values in [starts[i], stops[i]) are moved by offsets[i], and every
+    other value is left where it is. Pieces with a zero offset are dropped.
+    """
 
-        for domain_range in self.domain:
-            partition_points.extend([domain_range.start, domain_range.end + 1])
-
-        parts = range_.partition(partition_points)
-
-        for part in parts:
-            for i, domain_range in enumerate(self.domain):
-                if not domain_range.includes(part):
-                    continue
-                offset = part.start - domain_range.start
-                mapped_start = self.image[i].start + offset
-                length = part.length
-                outputs.append(Range(mapped_start, length))
-                break
+    def __init__(self, domain: list[Range], image: list[Range]):
+        pieces = [
+            (d.start, d.end + 1, i.start - d.start) for d, i in zip(domain, image)
+        ]
+        self._set_pieces(pieces)
+
+    @classmethod
+    def from_pieces(cls, pieces: list[tuple[int, int, int]]):
+        map_ = cls.__new__(cls)
+        map_._set_pieces(pieces)
+        return map_
+
+    def _set_pieces(self, pieces):
+        self.starts = []
+        self.stops = []
+        self.offsets = []
+        for start, stop, offset in sorted(pieces):
+            if not offset or start >= stop:
+                continue
+            # neighbouring pieces with the same shift are one piece
+            if self.stops and self.stops[-1] == start and self.offsets[-1] == offset:
+                self.stops[-1] = stop
+                continue
+            self.starts.append(start)
+            self.stops.append(stop)
+            self.offsets.append(offset)
+
+        self._arrays = None
+
+    def lookup(self, value: int):
+        i = bisect_right(self.starts, value) - 1
+        if i >= 0 and value < self.stops[i]:
+            return value + self.offsets[i]
+        return value
+
+    def lookup_many(self, values: np.ndarray):
+        """Vectorized lookup of a whole array of values at once."""
+        if self._arrays is None:
+            self._arrays = tuple(
+                np.array(a, np.int64) for a in (self.starts, self.stops, self.offsets)
+            )
+        starts, stops, offsets = self._arrays
+
+        if not len(starts):
+            return values.copy()
+
+        i = np.searchsorted(starts, values, side="right") - 1
+        clipped = np.maximum(i, 0)
+        inside = (i >= 0) & (values < stops[clipped])
+        return values + np.where(inside, offsets[clipped], 0)
+
+    def segments(self, start: int, stop: int, i: int = 0):
+        """Split [start, stop) along the pieces, yielding (start, stop, offset).
+
+        i is a hint for where to begin the search, which lets callers that
+        walk a sorted batch of ranges sweep through the pieces only once.
+        """
+        # i is kept as the last piece that starts at or before start
+        i = bisect_right(self.starts, start, lo=i) - 1
+        while start < stop:
+            if i >= 0 and start < self.stops[i]:
+                end = min(stop, self.stops[i])
+                yield start, end, self.offsets[i]
             else:
-                outputs.append(part)
-
-        return outputs
+                next_start = self.starts[i + 1] if i + 1 < len(self.starts) else stop
+                end = min(stop, next_start)
+                yield start, end, 0
+            start = end
+            if i + 1 < len(self.starts) and self.starts[i + 1] <= start:
+                i += 1
 
+    def map(self, ranges: list[Range]):
+        outputs = []
+        i = 0
+        for r in sorted(ranges, key=lambda r: r.start):
+            i = max(bisect_right(self.starts, r.start, lo=i) - 1, 0)
+            for start, stop, offset in self.segments(r.start, r.end + 1, i):
+                outputs.append(Range(start + offset, stop - start))
+        return coalesce(outputs)
+
+    def then(self, other: "Map"):
+        """Compose two maps into one that applies self and then other."""
+        pieces = []
+
+        # values that self moves are carried on through other
+        for start, stop, offset in zip(self.starts, self.stops, self.offsets):
+            for s, t, o in other.segments(start + offset, stop + offset):
+                pieces.append((s - offset, t - offset, offset + o))
+
+        # values that self leaves alone are only moved by other
+        for start, stop, offset in zip(other.starts, other.stops, other.offsets):
+            for s, t, o in self.segments(start, stop):
+                if not o:
+                    pieces.append((s, t, offset))
+
+        return Map.from_pieces(pieces)
+
+    def to_json(self):
+        return json.dumps(
+            [
+                [start + offset, start, stop - start]
+                for start, stop, offset in zip(self.starts, self.stops, self.offsets)
+            ]
+        )
+
+    @classmethod
+    def from_json(cls, s: str):
+        mapping_data = json.loads(s)
+        domain = [Range(source, length) for _, source, length in mapping_data]
+        image = [Range(dest, length) for dest, _, length in mapping_data]
+        return cls(domain, image)
+
+
+MAP_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
 
-with open("input.txt", "r") as file:
-    almanac = file.read().split("\n\n")
-
-seeds_section, maps_section = almanac[0], almanac[1:]
-
-maps = {}
 
+def parse(path):
+    with open(path, "r") as file:
+        almanac = file.read().strip().split("\n\n")
 
-for map_text in maps_section:
-    lines = map_text.split("\n")
+    seeds_section, maps_section = almanac[0], almanac[1:]
 
-    map_name = lines[0].split()[0]
+    maps = {}
 
-    mapping_data = [
-        [int(value) for value in mapping_string.split()] for mapping_string in lines[1:]
-    ]
+    for map_text in maps_section:
+        lines = map_text.split("\n")
 
-    domain = []
-    image = []
-    for dest, source, length in mapping_data:
-        domain.append(Range(source, length))
-        image.append(Range(dest, length))
+        map_name = lines[0].split()[0]
 
-    maps[map_name] = Map(domain, image)
+        mapping_data = [
+            [int(value) for value in mapping_string.split()]
+            for mapping_string in lines[1:]
+        ]
 
+        domain = []
+        image = []
+        for dest, source, length in mapping_data:
+            domain.append(Range(source, length))
+            image.append(Range(dest, length))
 
-def seed_to_location(range_: Range):
-    outputs = [range_]
-    for map_name in [
-        "seed-to-soil",
-        "soil-to-fertilizer",
-        "fertilizer-to-water",
-        "water-to-light",
-        "light-to-temperature",
-        "temperature-to-humidity",
-        "humidity-to-location",
-    ]:
-        outputs = maps[map_name].map(outputs)
-    return outputs
+        maps[map_name] = Map(domain, image)
 
+    seeds_data = [int(seed_string) for seed_string in seeds_section[7:].split()]
 
-seeds_data = [int(seed_string) for seed_string in seeds_section[7:].split()]
+    # The seven maps are folded into a single map from seeds to locations, so
+    # each seed or seed range only has to be split up once
+    seed_to_location = reduce(Map.then, [maps[map_name] for map_name in MAP_NAMES])
 
+    return seeds_data, seed_to_location
 
-# Part 1
 
-single_seeds = [Range(value, 1) for value in seeds_data]
+def part1(almanac) -> int:
+    seeds_data, seed_to_location = almanac
 
-location_numbers = []
+    location_numbers = seed_to_location.lookup_many(np.array(seeds_data, np.int64))
 
-for seed_data in single_seeds:
-    location_range = seed_to_location(seed_data)
-    location_numbers.append(location_range[0].start)
+    return int(location_numbers.min())
 
-print(f"Part 1: The lowest location number is {min(location_numbers)}")
 
+def part2(almanac) -> int:
+    seeds_data, seed_to_location = almanac
 
-# Part 2
+    ranged_seeds = [
+        Range(seed, length) for seed, length in zip(seeds_data[::2], seeds_data[1::2])
+    ]
 
-ranged_seeds = [
-    Range(seed, length) for seed, length in zip(seeds_data[::2], seeds_data[1::2])
-]
+    all_location_ranges = seed_to_location.map(ranged_seeds)
 
-all_location_ranges = []
+    return min(location_range.start for location_range in all_location_ranges)
 
-for seed_data in ranged_seeds:
-    location_ranges = seed_to_location(seed_data)
-    all_location_ranges.extend(location_ranges)
 
-minimal_location_numbers = [
-    location_range.start for location_range in all_location_ranges
-]
+if __name__ == "__main__":
+    almanac = parse("input.txt")
 
-print(f"Part 2: The new lowest location number is {min(minimal_location_numbers)}")
+    print(f"Part 1: The lowest location number is {part1(almanac)}")
+    print(f"Part 2: The new lowest location number is {part2(almanac)}")
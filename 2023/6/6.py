@@ -1,11 +1,42 @@
-with open("input.txt", "r") as file:
-    stats = file.read().splitlines()
-
-times: list[str] = stats[0].split()[1:]
-best_distances: list[str] = stats[1].split()[1:]
+from math import isqrt, prod
 
 
 def determine_winning_methods_count(time, best_distance):
+    # we need hold * (time - hold) > best_distance, so the winning hold times
+    # are the integers strictly between the roots of
+    # hold^2 - time * hold + best_distance = 0, which are symmetric about time / 2
+    best_hold = time // 2
+    if best_hold * (time - best_hold) <= best_distance:
+        return 0
+
+    discriminant = time * time - 4 * best_distance
+
+    # isqrt keeps everything in exact integer arithmetic, so we only need to
+    # nudge the estimate by a step to land on the first winning hold time
+    shortest_hold = (time - isqrt(discriminant)) // 2
+    while shortest_hold * (time - shortest_hold) <= best_distance:
+        shortest_hold += 1
+    while (
+        shortest_hold > 0
+        and (shortest_hold - 1) * (time - shortest_hold + 1) > best_distance
+    ):
+        shortest_hold -= 1
+
+    # holding for no time or the full race can only win a negative record
+    shortest_hold = max(shortest_hold, 0)
+    longest_hold = min(time - shortest_hold, time - 1)
+
+    return max(longest_hold - shortest_hold + 1, 0)
+
+
+def determine_winning_methods_counts(races):
+    return [
+        determine_winning_methods_count(time, best_distance)
+        for time, best_distance in races
+    ]
+
+
+def brute_force_winning_methods_count(time, best_distance):
     winning_methods_count = 0
     for button_hold_time in range(time):
         speed = button_hold_time
@@ -18,28 +49,40 @@ def determine_winning_methods_count(time, best_distance):
     return winning_methods_count
 
 
-# Part 1
+def parse(path) -> tuple[list[str], list[str]]:
+    with open(path, "r") as file:
+        stats = file.read().splitlines()
+
+    times: list[str] = stats[0].split()[1:]
+    best_distances: list[str] = stats[1].split()[1:]
+
+    return times, best_distances
+
+
+def part1(stats) -> int:
+    times, best_distances = stats
 
-races = [
-    (int(time), int(best_distance))
-    for (time, best_distance) in zip(times, best_distances)
-]
+    races = [
+        (int(time), int(best_distance))
+        for (time, best_distance) in zip(times, best_distances)
+    ]
 
-winning_method_product = 1
+    return prod(determine_winning_methods_counts(races))
 
-for time, best_distance in races:
-    winning_method_product *= determine_winning_methods_count(time, best_distance)
 
-print(
-    f"Part 1: You get {winning_method_product} when you multiply together the number of ways you can beat each record"
-)
+def part2(stats) -> int:
+    times, best_distances = stats
 
+    time = int("".join(times))
+    best_distance = int("".join(best_distances))
 
-# Part 2
+    return determine_winning_methods_count(time, best_distance)
 
-time = int("".join(times))
-best_distance = int("".join(best_distances))
 
-winning_methods_count = determine_winning_methods_count(time, best_distance)
+if __name__ == "__main__":
+    stats = parse("input.txt")
 
-print(f"Part 2: There are {winning_methods_count} ways of beating the longer race")
+    print(
+        f"Part 1: You get {part1(stats)} when you multiply together the number of ways you can beat each record"
+    )
+    print(f"Part 2: There are {part2(stats)} ways of beating the longer race")
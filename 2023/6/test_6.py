@@ -0,0 +1,22 @@
+import importlib.util
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location("day6", Path(__file__).with_name("6.py"))
+day6 = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(day6)
+
+
+def test_closed_form_matches_brute_force():
+    # the closed form has to agree with the linear scan on small races,
+    # including records that can't be beaten and ones that can't be missed
+    for time in range(40):
+        for best_distance in range(-5, time * time // 4 + 5):
+            assert day6.determine_winning_methods_count(
+                time, best_distance
+            ) == day6.brute_force_winning_methods_count(time, best_distance)
+
+
+def test_example():
+    stats = (["7", "15", "30"], ["9", "40", "200"])
+    assert day6.part1(stats) == 288
+    assert day6.part2(stats) == 71503
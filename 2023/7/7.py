@@ -1,80 +1,249 @@
-import re
-
-with open("input.txt", "r") as file:
-    lines = file.read().splitlines()
+from collections import defaultdict, deque
+
+# hand strengths keyed by the card multiplicities, largest first
+HAND_STRENGTHS = {
+    (5,): 6,  # 5 of a kind
+    (4, 1): 5,  # 4 of a kind
+    (3, 2): 4,  # full house
+    (3, 1, 1): 3,  # 3 of a kind
+    (2, 2, 1): 2,  # 2 pairs
+    (2, 1, 1, 1): 1,  # 1 pair
+    (1, 1, 1, 1, 1): 0,  # high card
+}
+
+# the best a hand can do with its wildcards, keyed by the multiplicities of
+# the other cards and the number of wildcards; the wildcards always join the
+# most common card
+WILDCARD_STRENGTHS = {(): {5: 6}}
+for signature, strength in HAND_STRENGTHS.items():
+    most_common, *others = signature
+    for wildcard_count in range(most_common - max(others, default=0) + 1):
+        if wildcard_count < most_common:
+            rest = (most_common - wildcard_count, *others)
+            WILDCARD_STRENGTHS.setdefault(rest, {})[wildcard_count] = strength
+
+# counting, for every card, the cards that match it adds up the squares of the
+# multiplicities, which (with the number of wildcards) is enough to tell every
+# signature apart without having to build and sort the multiplicities
+STRENGTHS = {
+    (wildcard_count, sum(m * m for m in signature)): strength
+    for signature, strengths in WILDCARD_STRENGTHS.items()
+    for wildcard_count, strength in strengths.items()
+}
+
+# each card translates to the hex digit of its value
+CARD_VALUES = str.maketrans("23456789TJQKA", "23456789abcde")
+WILDCARD_VALUES = str.maketrans("23456789TJQKA", "23456789a1cde")
 
 
 def rank(hand, card_values, wildcard=None):
-    no_wildcards_hand = hand.replace(wildcard, "") if wildcard else hand
-    wildcard_count = hand.count(wildcard) if wildcard else 0
-
-    repeated_cards = re.findall(r"(\w)(?=\w*(\1)\w*)", no_wildcards_hand)
-    unique_repeated_cards_count = len(set(repeated_cards))
-
-    if not unique_repeated_cards_count and wildcard_count > 0:
-        unique_repeated_cards_count += 1
-
-    repeated_card_count = min(
-        len(repeated_cards) + unique_repeated_cards_count + wildcard_count, 5
-    )
-
-    hand_strength = 0  # high card
-    match (repeated_card_count, unique_repeated_cards_count):
-        case (5, 1):  # 5 of a kind
-            hand_strength = 6
-        case (4, 1):  # 4 of a kind
-            hand_strength = 5
-        case (5, 2):  # full house
-            hand_strength = 4
-        case (3, 1):  # 3 of a kind
-            hand_strength = 3
-        case (4, 2):  # 2 pairs
-            hand_strength = 2
-        case (2, 1):  # 1 pair
-            hand_strength = 1
-
-    numeric_hand = [
-        int(card_values[card] if card_values.get(card) else card) for card in [*hand]
-    ]  # converts eg AAJ42 to [14, 14, 11, 4, 2]
-
-    # we will represent the hand as a base-13 number written in decimal
-    hand_strength = hand_strength * (13**5)
-    relative_hand_strength = 0
-    for i, card_value in enumerate(numeric_hand):
-        relative_hand_strength += card_value * (13 ** (4 - i))
-
-    return hand_strength + relative_hand_strength
+    # cards are packed four bits apiece below the hand strength, so a single
+    # integer compares hands the same way the rules do
+    relative_hand_strength = int(hand.translate(card_values), 16)
+
+    others = hand.replace(wildcard, "") if wildcard else hand
+    matches = sum(map(others.count, others))
+    hand_strength = STRENGTHS[len(hand) - len(others), matches]
+
+    return hand_strength << 20 | relative_hand_strength
 
 
 def calc_total_winnings(ranked_hands):
     total_winnings = 0
     for r, hand in enumerate(ranked_hands):
-        (_, bid) = hand
+        _, bid = hand
         total_winnings += (r + 1) * bid
     return total_winnings
 
 
-hands = []
-for line in lines:
-    hand, bid = line.split()
-    hands.append((hand, int(bid)))
+class FenwickTree:
+    """Hand counts and bid sums over integer positions, by prefix.
+
+    Updates and prefix sums take one step per bit of the size, which is the
+    23 bits of a packed hand key by default. Only the nodes that have been
+    touched are stored, keeping memory in line with the number of hands.
+    """
+
+    def __init__(self, size=1 << 23):
+        self.size = size
+        self.counts = defaultdict(int)
+        self.bids = defaultdict(int)
+
+    def add(self, position, count, bid):
+        counts, bids = self.counts, self.bids
+        i = position + 1
+        while i <= self.size:
+            counts[i] += count
+            bids[i] += bid
+            i += i & -i
+
+    def sum_below(self, position):
+        # the number of hands and their total bid over every position below this one
+        counts, bids = self.counts, self.bids
+        count = bid = 0
+        i = position
+        while i > 0:
+            if i in counts:
+                count += counts[i]
+                bid += bids[i]
+            i -= i & -i
+        return count, bid
+
+
+class EqualHands:
+    """The hands sharing a key, which rank in the order they were added.
+
+    Each hand gets the next sequence number, and a Fenwick tree over those
+    gives the count and bids of the equal hands added before any of them.
+    """
+
+    def __init__(self):
+        self.tree = FenwickTree(1 << 32)
+        self.next_sequence = 0
+        # the sequence numbers of the hands still here, by bid, oldest first
+        self.sequences = defaultdict(deque)
+
+    def add(self, bid):
+        sequence = self.next_sequence
+        self.next_sequence += 1
+        self.sequences[bid].append(sequence)
+        self.tree.add(sequence, 1, bid)
+        return sequence
+
+    def remove(self, bid):
+        # the earliest equal hand with this bid goes, as it's the same hand
+        sequence = self.sequences[bid].popleft()
+        if not self.sequences[bid]:
+            del self.sequences[bid]
+        self.tree.add(sequence, -1, -bid)
+        return sequence
+
+    def __contains__(self, bid):
+        return bid in self.sequences
+
+
+class HandBook:
+    """Hands ranked as they are added and removed, with live total winnings.
+
+    The rank of a hand is one more than the number of hands below it, so
+    adding a hand earns its bid times that rank and moves every hand above it
+    up one rank, adding their bids once more; removing a hand undoes the same.
+    Counts and bids are kept in a Fenwick tree over the hand keys, and equal
+    hands rank in the order they were added, as in a stable sort, so both
+    take O(log n) however many of the hands are the same.
+    """
+
+    def __init__(self, card_values=CARD_VALUES, wildcard=None):
+        self.card_values = card_values
+        self.wildcard = wildcard
+        self.tree = FenwickTree()
+        self.equal_hands = defaultdict(EqualHands)
+        self.hand_count = 0
+        self.total_bids = 0
+        self.total_winnings = 0
+
+    def __len__(self):
+        return self.hand_count
+
+    def add(self, hand, bid):
+        key = rank(hand, self.card_values, self.wildcard)
+
+        # the new hand ranks above every hand with a key up to its own
+        count_below, bids_below = self.tree.sum_below(key + 1)
+        self.total_winnings += (count_below + 1) * bid
+        self.total_winnings += self.total_bids - bids_below
+
+        self.equal_hands[key].add(bid)
+        self.tree.add(key, 1, bid)
+        self.hand_count += 1
+        self.total_bids += bid
+
+    def remove(self, hand, bid):
+        key = rank(hand, self.card_values, self.wildcard)
+        if key not in self.equal_hands or bid not in self.equal_hands[key]:
+            raise KeyError(f"{hand} {bid} is not in the book")
+
+        equal_hands = self.equal_hands[key]
+        sequence = equal_hands.remove(bid)
+        if not equal_hands.sequences:
+            del self.equal_hands[key]
+
+        count_below, bids_below = self.tree.sum_below(key)
+        equal_count_below, equal_bids_below = equal_hands.tree.sum_below(sequence)
+        count_below += equal_count_below
+        bids_below += equal_bids_below + bid
+        self.total_winnings -= (count_below + 1) * bid
+        self.total_winnings -= self.total_bids - bids_below
+
+        self.tree.add(key, -1, -bid)
+        self.hand_count -= 1
+        self.total_bids -= bid
+
+
+def hand_books():
+    """An empty book for each of the normal and the joker rules."""
+    return HandBook(CARD_VALUES), HandBook(WILDCARD_VALUES, "J")
+
+
+def stream(lines) -> tuple[int, int]:
+    """Solve both parts from any iterable of lines in bounded memory.
+
+    Hands with the same key are next to each other once sorted, so it is
+    enough to keep, for each distinct key, how many hands had it, the sum of
+    their bids and the sum of each bid times the number of earlier hands with
+    the same key (which is how a stable sort orders them). There are only
+    13**5 possible hands, so memory stops growing however long the input is.
+    """
+    groups = ({}, {})
+
+    for line in lines:
+        if not line.strip():
+            continue
+        hand, bid = line.split()
+        bid = int(bid)
+
+        keys = rank(hand, CARD_VALUES), rank(hand, WILDCARD_VALUES, "J")
+        for group, key in zip(groups, keys):
+            count, bids, weighted_bids = group.get(key, (0, 0, 0))
+            group[key] = (count + 1, bids + bid, weighted_bids + count * bid)
+
+    return tuple(calc_grouped_winnings(group) for group in groups)
+
+
+def calc_grouped_winnings(group):
+    total_winnings = 0
+    r = 1
+    for key in sorted(group):
+        count, bids, weighted_bids = group[key]
+        total_winnings += r * bids + weighted_bids
+        r += count
+    return total_winnings
+
 
+def parse(path) -> list[tuple[str, int]]:
+    with open(path, "r") as file:
+        lines = file.read().splitlines()
 
-# Part 1
+    hands = []
+    for line in lines:
+        hand, bid = line.split()
+        hands.append((hand, int(bid)))
 
-card_values = {"A": "14", "K": "13", "Q": "12", "J": "11", "T": "10"}
-rank_hand = lambda h: rank(h[0], card_values)
+    return hands
 
-ranked_hands = sorted(hands, key=rank_hand)
 
-print(f"Part 1: The total winnings are {calc_total_winnings(ranked_hands)}")
+def part1(hands) -> int:
+    ranked_hands = sorted(hands, key=lambda h: rank(h[0], CARD_VALUES))
+    return calc_total_winnings(ranked_hands)
 
 
-# Part 2
+def part2(hands) -> int:
+    ranked_hands = sorted(hands, key=lambda h: rank(h[0], WILDCARD_VALUES, "J"))
+    return calc_total_winnings(ranked_hands)
 
-card_values = {"A": "13", "K": "12", "Q": "11", "T": "10", "J": "1"}
-rank_hand = lambda h: rank(h[0], card_values, "J")
 
-ranked_hands = sorted(hands, key=rank_hand)
+if __name__ == "__main__":
+    hands = parse("input.txt")
 
-print(f"Part 2: The new total winnings are {calc_total_winnings(ranked_hands)}")
+    print(f"Part 1: The total winnings are {part1(hands)}")
+    print(f"Part 2: The new total winnings are {part2(hands)}")
@@ -0,0 +1,59 @@
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+spec = importlib.util.spec_from_file_location("day7", Path(__file__).with_name("7.py"))
+day7 = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(day7)
+
+EXAMPLE = [
+    ("32T3K", 765),
+    ("T55J5", 684),
+    ("KK677", 28),
+    ("KTJJT", 220),
+    ("QQQJA", 483),
+]
+
+
+def test_example():
+    assert day7.part1(EXAMPLE) == 6440
+    assert day7.part2(EXAMPLE) == 5905
+    assert day7.stream(f"{hand} {bid}\n" for hand, bid in EXAMPLE) == (6440, 5905)
+
+
+def test_hand_books_match_sorting():
+    rng = random.Random(7)
+    for _ in range(300):
+        # few cards and bids, so that equal hands and equal bids come up often
+        pool = ["".join(rng.choices("2J3KA", k=5)) for _ in range(8)]
+        normal, jokers = day7.hand_books()
+        hands = []
+
+        for _ in range(rng.randint(1, 60)):
+            if hands and rng.random() < 0.35:
+                # the earliest of equal hands with equal bids is the one to go
+                hand = rng.choice(hands)
+                hands.remove(hand)
+                normal.remove(*hand)
+                jokers.remove(*hand)
+            else:
+                hand = rng.choice(pool), rng.randint(1, 5)
+                hands.append(hand)
+                normal.add(*hand)
+                jokers.add(*hand)
+
+            assert normal.total_winnings == day7.part1(hands)
+            assert jokers.total_winnings == day7.part2(hands)
+            assert len(normal) == len(jokers) == len(hands)
+
+
+def test_removing_a_missing_hand():
+    book = day7.HandBook()
+    book.add("AAAAA", 1)
+    with pytest.raises(KeyError):
+        book.remove("AAAAA", 2)
+    with pytest.raises(KeyError):
+        book.remove("22222", 1)
+    assert book.total_winnings == 1
@@ -1,118 +1,277 @@
 import re
-import time
-from multiprocessing import Process, Queue
+from math import gcd
 
-with open("input.txt", "r") as file:
-    document = file.read()
+import numpy as np
 
-instructions, network = document.split("\n\n")
 
-nodes = {}
+class Network:
+    """The node map compiled down to integer arrays.
 
-for node in network.split("\n"):
-    name, left, right = re.findall(r"\w{3}", node)
-    nodes[name] = (left, right)
+    Node i goes to left[i] on an L and right[i] on an R. The instructions are
+    stored as 0 (L) / 1 (R) so that moves[instructions[s]] is the transition
+    array for step s, and is_z / is_a mark the nodes ending in Z / A.
+    """
 
+    def __init__(self, instructions: str, nodes: dict[str, tuple[str, str]]):
+        self.names = list(nodes.keys())
+        self.index = {name: i for i, name in enumerate(self.names)}
 
-def change_node(current_node, instruction):
-    match instruction:
-        case "L":
-            return nodes[current_node][0]
-        case "R":
-            return nodes[current_node][1]
-    raise Exception("Invalid instruction provided")
+        self.left = np.array([self.index[l] for l, _ in nodes.values()], np.int64)
+        self.right = np.array([self.index[r] for _, r in nodes.values()], np.int64)
+        self.moves = np.stack((self.left, self.right))
 
+        self.is_z = np.array([name[-1] == "Z" for name in self.names])
+        self.is_a = np.array([name[-1] == "A" for name in self.names])
 
-def get_instruction(steps):
-    return instructions[steps % len(instructions)]
+        self.instructions = np.array(
+            ["LR".index(instruction) for instruction in instructions], np.uint8
+        )
 
+        # plain lists are much faster than numpy for single scalar lookups
+        self._moves = self.moves.tolist()
+        self._instructions = self.instructions.tolist()
+        self._is_z = self.is_z.tolist()
 
-def worker(current_node, output):
-    steps = 0
-    while True:
-        instruction = get_instruction(steps)
-        current_node = change_node(current_node, instruction)
+    def __len__(self):
+        return len(self.names)
 
-        if current_node[-1] == "Z":
-            output.put(steps + 1)
+    def step(self, positions: np.ndarray, steps: int, start: int = 0):
+        """Advance every ghost in positions by steps, starting at step start."""
+        period = len(self.instructions)
+        for s in range(start, start + steps):
+            positions = self.moves[self._instructions[s % period]][positions]
+        return positions
 
-        steps += 1
+    def walk(self, node: int, start: int = 0):
+        """Yield the nodes a single ghost visits after steps start + 1, ..."""
+        moves, instructions = self._moves, self._instructions
+        period = len(instructions)
+        steps = start
+        while True:
+            node = moves[instructions[steps % period]][node]
+            steps += 1
+            yield node
+
+
+class JumpTable:
+    """Binary lifting over whole passes of the instruction string.
+
+    jumps[k][x] is where a ghost starting on node x at the beginning of the
+    instructions ends up after 2**k full passes, and hits[k][x] is the first
+    step within those 2**k passes that lands on a Z node (or -1 if none do).
+    Jump levels are added lazily, so arbitrarily large step counts can be
+    queried.
+    """
+
+    def __init__(self, network: Network):
+        self.network = network
+        self.period = len(network.instructions)
+
+        positions = np.arange(len(network))
+        first_hit = np.full(len(network), -1, np.int64)
+        for t in range(self.period):
+            first_hit[(first_hit < 0) & network.is_z[positions]] = t
+            positions = network.step(positions, 1, t)
+
+        self.jumps = [positions]
+        self.hits = [first_hit]
+
+        # a ghost that misses every Z node for len(network) passes has repeated
+        # its pass-boundary node and will never reach one, so hits are only
+        # needed up to that level; jumps are extended further on demand
+        while 2 ** (len(self.hits) - 1) < len(network):
+            jumps, hits = self.jumps[-1], self.hits[-1]
+            span = 2 ** (len(self.hits) - 1) * self.period
+            later_hits = hits[jumps]
+            self.hits.append(
+                np.where(
+                    hits >= 0, hits, np.where(later_hits >= 0, later_hits + span, -1)
+                )
+            )
+            self.jumps.append(jumps[jumps])
+
+    def position_after(self, node: int, steps: int) -> int:
+        """Return the node a ghost starting on node is on after steps steps."""
+        passes, remainder = divmod(steps, self.period)
+
+        while len(self.jumps) < passes.bit_length():
+            self.jumps.append(self.jumps[-1][self.jumps[-1]])
+
+        for k in range(passes.bit_length()):
+            if passes >> k & 1:
+                node = int(self.jumps[k][node])
+
+        return int(self.network.step(np.array(node), remainder))
+
+    def first_hit(self, node: int, steps: int = 0):
+        """Return the first step at or after steps that lands on a Z node.
+
+        The ghost starts on node at step 0. Returns None if it never does.
+        """
+        node = self.position_after(node, steps)
+
+        # walk to the next pass boundary by hand
+        is_z = self.network._is_z
+        walk = self.network.walk(node, steps)
+        while steps % self.period:
+            if is_z[node]:
+                return steps
+            node = next(walk)
+            steps += 1
+
+        for k in reversed(range(len(self.hits))):
+            if self.hits[k][node] < 0:
+                node = int(self.jumps[k][node])
+                steps += 2**k * self.period
+
+        if self.hits[0][node] < 0:
+            return None
+
+        return steps + int(self.hits[0][node])
+
+
+def parse(path) -> Network:
+    with open(path, "r") as file:
+        document = file.read()
+
+    instructions, network = document.strip().split("\n\n")
+
+    nodes = {}
+
+    for node in network.split("\n"):
+        name, left, right = re.findall(r"\w{3}", node)
+        nodes[name] = (left, right)
+
+    return Network(instructions, nodes)
+
+
+def count_steps(network, start_node="AAA", end_node="ZZZ"):
+    end = network.index[end_node]
+    node = network.index[start_node]
+    if node == end:
+        return 0
+    for steps, node in enumerate(network.walk(node), 1):
+        if node == end:
+            return steps
+
+
+def find_cycle(network, start_node):
+    """Walk a ghost until its (node, instruction index) state repeats.
+
+    Returns (mu, lam, pre_hits, cycle_hits) where mu is the step at which the
+    cycle is entered, lam is the cycle length, pre_hits are the steps before
+    mu that land on a Z node and cycle_hits are the steps in [mu, mu + lam)
+    that land on a Z node. Every later hit is a cycle hit plus a multiple of lam.
+    """
+    period = len(network.instructions)
+    is_z = network._is_z
+
+    # states are packed into a single int as node * period + instruction index
+    seen = {start_node * period: 0}
+    hits = [0] if is_z[start_node] else []
+
+    for steps, node in enumerate(network.walk(start_node), 1):
+        state = node * period + steps % period
+        if state in seen:
+            break
+        seen[state] = steps
+        if is_z[node]:
+            hits.append(steps)
+
+    mu = seen[state]
+    lam = steps - mu
+
+    pre_hits = [h for h in hits if h < mu]
+    cycle_hits = [h for h in hits if h >= mu]
+
+    return mu, lam, pre_hits, cycle_hits
+
+
+def is_hit(cycle, steps):
+    mu, lam, pre_hits, cycle_hits = cycle
+    if steps < mu:
+        return steps in pre_hits
+    return (steps - mu) % lam + mu in cycle_hits
+
+
+def combine_congruences(a1, n1, a2, n2):
+    # solves x = a1 (mod n1), x = a2 (mod n2) for moduli that need not be coprime
+    g = gcd(n1, n2)
+    if (a2 - a1) % g:
+        return None
+    lcm = n1 // g * n2
+    k = (a2 - a1) // g * pow(n1 // g, -1, n2 // g) % (n2 // g)
+    return (a1 + n1 * k) % lcm, lcm
+
+
+def first_common_hit(cycles):
+    """Return the first step at which every ghost is on a Z node, or None."""
+    # before every ghost has entered its cycle we simply check the (finitely
+    # many) hits of the first ghost against all the others
+    threshold = max(mu for mu, _, _, _ in cycles)
+
+    mu, lam, pre_hits, cycle_hits = cycles[0]
+    candidates = [h for h in pre_hits if h < threshold]
+    for h in cycle_hits:
+        candidates.extend(range(h, threshold, lam))
+
+    for steps in sorted(candidates):
+        if all(is_hit(cycle, steps) for cycle in cycles):
+            return steps
+
+    # after that every ghost is purely periodic, so its hits are a set of
+    # residues modulo its cycle length which we combine with the CRT
+    residues, modulus = {0}, 1
+    for mu, lam, pre_hits, cycle_hits in cycles:
+        combined = set()
+        for r in residues:
+            for h in cycle_hits:
+                solution = combine_congruences(r, modulus, h % lam, lam)
+                if solution:
+                    combined.add(solution[0])
+        residues, modulus = combined, modulus // gcd(modulus, lam) * lam
+
+    if not residues:
+        return None
+
+    return min(r - (r - threshold) // modulus * modulus for r in residues)
+
+
+def count_ghost_steps(network):
+    start_nodes = np.flatnonzero(network.is_a).tolist()
+    cycles = [find_cycle(network, node) for node in start_nodes]
+    return first_common_hit(cycles)
+
+
+def brute_force_ghost_steps(network, limit):
+    """Step every ghost together until they all sit on a Z node.
+
+    Only intended for exploring networks; returns None if it takes more than
+    limit steps.
+    """
+    positions = np.flatnonzero(network.is_a)
+    period = len(network.instructions)
+
+    for s in range(limit):
+        if network.is_z[positions].all():
+            return s
+        positions = network.moves[network._instructions[s % period]][positions]
+
+    return limit if network.is_z[positions].all() else None
+
+
+def part1(network) -> int:
+    return count_steps(network)
+
+
+def part2(network) -> int:
+    return count_ghost_steps(network)
 
 
 if __name__ == "__main__":
-    # Part 1
-
-    current_node = "AAA"
-    steps = 0
-
-    while current_node != "ZZZ":
-        instruction = get_instruction(steps)
-        current_node = change_node(current_node, instruction)
-        steps += 1
-
-    print(f"part 1: it takes {steps} steps to reach zzz")
-
-    # current_nodes = [name for name in nodes.keys() if name[-1] == "a"]
-    # steps = 0
-    #
-    # st = time.time()
-    # # while any(name[-1] != "Z" for name in current_nodes):
-    # while steps < 100000000:
-    #     instruction = get_instruction(steps)
-    #     current_nodes = [change_node(node, instruction) for node in current_nodes]
-    #     steps += 1
-    #
-    # et = time.time()
-    #
-    # print(et - st)
-    # Part 2
-
-    st = time.time()
-    current_nodes = [name for name in nodes.keys() if name[-1] == "A"]
-    # outputs = [Queue() for _ in current_nodes]
-    # processes = []
-    #
-    # for i in range(len(outputs)):
-    #     p = Process(target=worker, args=(current_nodes[i], outputs[i]))
-    #     p.start()
-    #     processes.append(p)
-    #
-    # next_steps = [output.get() for output in outputs]
-    # locked_index = 0
-    # locked_steps = next_steps[locked_index]
-    #
-    # while next_steps.count(locked_steps) != len(next_steps):
-    #     # while min(next_steps) < 100000000:
-    #     new_next_steps = [0] * len(next_steps)
-    #     for i, steps in enumerate(next_steps):
-    #         if i == locked_index or steps == locked_steps:
-    #             new_next_steps[i] = steps
-    #
-    #         if steps < locked_steps:
-    #             new_next_steps[i] = outputs[i].get()
-    #         else:
-    #             locked_index = i
-    #             locked_steps = steps
-    #             new_next_steps[i] = steps
-    #
-    #     next_steps = new_next_steps
-    #
-    # for p in processes:
-    #     p.terminate()
-    #
-    # et = time.time()
-    #
-    # print(et - st)
-    # print(next_steps)
-    print(current_nodes)
-
-    node = "BGA"
-    for i in range(10011408):
-        instruction = get_instruction(i)
-        node = change_node(node, instruction)
-
-    print(node)
-
-    # print(
-    #     f"Part 2: It takes {next_steps[0]} steps to end up entirely on nodes that end in Z"
-    # )
+    network = parse("input.txt")
+
+    print(f"part 1: it takes {part1(network)} steps to reach zzz")
+    print(
+        f"Part 2: It takes {part2(network)} steps to end up entirely on nodes that end in Z"
+    )
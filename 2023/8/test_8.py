@@ -0,0 +1,40 @@
+import importlib.util
+import random
+from pathlib import Path
+
+import numpy as np
+
+spec = importlib.util.spec_from_file_location("day8", Path(__file__).with_name("8.py"))
+day8 = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(day8)
+
+EXAMPLE = Path(__file__).with_name("test.txt")
+
+
+def test_example():
+    assert day8.part2(day8.parse(EXAMPLE)) == 6
+
+
+def test_cycle_analysis_matches_brute_force():
+    rng = random.Random(1)
+    for _ in range(1000):
+        names = [f"{i:02d}{rng.choice('AZBZ')}" for i in range(rng.randint(2, 9))]
+        if not any(name.endswith("A") for name in names):
+            continue
+        nodes = {name: (rng.choice(names), rng.choice(names)) for name in names}
+        instructions = "".join(rng.choices("LR", k=rng.randint(1, 4)))
+
+        network = day8.Network(instructions, nodes)
+        assert day8.count_ghost_steps(network) == day8.brute_force_ghost_steps(
+            network, 3000
+        )
+
+
+def test_jump_table_reaches_the_answer():
+    # jumping every ghost straight to the answer lands them all on Z nodes
+    network = day8.parse(EXAMPLE)
+    steps = day8.part2(network)
+
+    jump_table = day8.JumpTable(network)
+    for node in np.flatnonzero(network.is_a).tolist():
+        assert network.is_z[jump_table.position_after(node, steps)]
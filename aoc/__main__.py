@@ -0,0 +1,127 @@
+import argparse
+import json
+import sys
+import time
+
+from aoc.batch import format_table, run_all
+from aoc.benchmark import SCALES, benchmark, format_header, format_row
+from aoc.cache import MAX_CACHE_BYTES
+from aoc.generators import generate
+from aoc.profiling import profile_day
+from aoc.runner import (
+    available_days,
+    format_result,
+    format_stream_result,
+    format_time,
+    load_day,
+    run_day,
+    stream_day,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="solve a single day and time each part")
+    run.add_argument("year", type=int)
+    run.add_argument("day", type=int)
+    run.add_argument(
+        "--input", help="defaults to the day's input.txt, - reads stdin with --stream"
+    )
+    run.add_argument("--repeat", type=int, default=1, metavar="N")
+    run.add_argument(
+        "--cache", action="store_true", help="reuse parsed inputs from earlier runs"
+    )
+    run.add_argument(
+        "--cache-size",
+        type=int,
+        default=MAX_CACHE_BYTES,
+        metavar="BYTES",
+        help="evict old cache entries beyond this total size",
+    )
+    run.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile each phase and print a JSON report instead",
+    )
+    run.add_argument(
+        "--stream",
+        action="store_true",
+        help="solve both parts in one pass over the input lines (days 1, 2, 3, 4, 7)",
+    )
+    run.add_argument(
+        "--top", type=int, default=15, help="hot functions to list when profiling"
+    )
+
+    all_ = commands.add_parser(
+        "all", help="solve every day and part of a year in parallel"
+    )
+    all_.add_argument("year", type=int)
+    all_.add_argument("--days", type=int, nargs="+", help="defaults to every day")
+    all_.add_argument("--workers", type=int, help="defaults to one per CPU")
+    all_.add_argument(
+        "--timeout", type=float, default=60.0, help="seconds allowed for each part"
+    )
+    all_.add_argument(
+        "--cache", action="store_true", help="reuse parsed inputs from earlier runs"
+    )
+
+    gen = commands.add_parser("generate", help="write a synthetic input to stdout")
+    gen.add_argument("year", type=int)
+    gen.add_argument("day", type=int)
+    gen.add_argument("size", type=int)
+    gen.add_argument("--seed", type=int, default=0)
+
+    bench = commands.add_parser(
+        "bench", help="time every day on generated inputs of growing size"
+    )
+    bench.add_argument("year", type=int)
+    bench.add_argument("--days", type=int, nargs="+", help="defaults to every day")
+    bench.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    bench.add_argument("--repeat", type=int, default=1, metavar="N")
+    bench.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run" and (args.profile or args.stream):
+        mode = "--profile" if args.profile else "--stream"
+        if args.profile and args.stream:
+            parser.error("--profile and --stream can't be used together")
+        if args.repeat != 1 or args.cache:
+            parser.error(f"--repeat and --cache can't be used with {mode}")
+        if args.stream and not hasattr(load_day(args.year, args.day), "stream"):
+            parser.error(f"{args.year} Day {args.day} has no streaming mode")
+
+    if args.command == "run" and args.profile:
+        report = profile_day(args.year, args.day, args.input, args.top)
+        print(json.dumps(report, indent=2, default=str))
+
+    elif args.command == "run" and args.stream:
+        result = stream_day(args.year, args.day, args.input)
+        print(format_stream_result(result))
+
+    elif args.command == "run":
+        result = run_day(
+            args.year, args.day, args.input, args.repeat, args.cache, args.cache_size
+        )
+        print(format_result(result))
+
+    elif args.command == "all":
+        start = time.perf_counter()
+        results = run_all(args.year, args.days, args.workers, args.timeout, args.cache)
+        print(format_table(results))
+        print(f"Total wall time: {format_time(time.perf_counter() - start)}")
+
+    elif args.command == "generate":
+        sys.stdout.write(generate(args.year, args.day, args.size, args.seed))
+
+    elif args.command == "bench":
+        days = args.days or available_days(args.year)
+        print(format_header())
+        for result in benchmark(args.year, days, args.scales, args.repeat, args.seed):
+            print(format_row(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
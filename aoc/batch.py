@@ -0,0 +1,121 @@
+"""Run every day and part of a year as independent jobs on a pool of processes.
+
+Each job parses its day's input and solves one part in its own process, so a
+job that runs past its timeout can simply be terminated without holding up
+the rest of the batch.
+"""
+
+import multiprocessing
+import os
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+from aoc.cache import cached_parse
+from aoc.runner import PARTS, available_days, format_time, input_path, load_day
+
+
+def solve(conn, year, day, part, path, cache):
+    try:
+        module = load_day(year, day)
+        parse = (lambda path: cached_parse(module, path)) if cache else module.parse
+
+        start = time.perf_counter()
+        parsed = parse(path)
+        parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        answer = getattr(module, part)(parsed)
+        solve_time = time.perf_counter() - start
+
+        conn.send(("ok", answer, parse_time, solve_time))
+    except Exception as error:
+        conn.send(("error", f"{type(error).__name__}: {error}", None, None))
+    finally:
+        conn.close()
+
+
+def run_all(year: int, days=None, workers=None, timeout=60.0, cache=False):
+    """Solve every part of every day, returning one result dict per job.
+
+    At most workers jobs run at once (one per CPU by default), and any job
+    still running timeout seconds after it started is terminated.
+    """
+    days = days or available_days(year)
+    workers = workers or os.cpu_count() or 1
+
+    results = []
+    pending = deque()
+    for day in days:
+        for part in PARTS:
+            job = {"year": year, "day": day, "part": part}
+            path = input_path(year, day)
+            if path.exists():
+                pending.append((job, str(path)))
+            else:
+                results.append({**job, "status": "no input"})
+
+    running = {}
+
+    while pending or running:
+        while pending and len(running) < workers:
+            job, path = pending.popleft()
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=solve,
+                args=(sender, year, job["day"], job["part"], path, cache),
+            )
+            process.start()
+            sender.close()
+            running[receiver] = (job, process, time.monotonic() + timeout)
+
+        next_deadline = min(deadline for _, _, deadline in running.values())
+        ready = wait(list(running), max(next_deadline - time.monotonic(), 0))
+
+        for receiver in ready:
+            job, process, _ = running.pop(receiver)
+            try:
+                status, answer, parse_time, solve_time = receiver.recv()
+            except EOFError:
+                # the process died without reporting back
+                status, answer, parse_time, solve_time = "crashed", None, None, None
+            receiver.close()
+            process.join()
+            results.append(
+                {
+                    **job,
+                    "status": status,
+                    "answer": answer,
+                    "parse_time": parse_time,
+                    "solve_time": solve_time,
+                }
+            )
+
+        now = time.monotonic()
+        for receiver, (job, process, deadline) in list(running.items()):
+            if deadline <= now:
+                process.terminate()
+                process.join()
+                receiver.close()
+                del running[receiver]
+                results.append({**job, "status": "timeout"})
+
+    return sorted(results, key=lambda r: (r["day"], r["part"]))
+
+
+def format_table(results) -> str:
+    lines = [f"{'day':>3} {'part':>4} {'answer':<24} {'parse':>10} {'solve':>10}"]
+    for result in results:
+        part = result["part"][-1]
+        if result["status"] == "ok":
+            lines.append(
+                f"{result['day']:>3} {part:>4} {result['answer']!s:<24}"
+                f" {format_time(result['parse_time']):>10}"
+                f" {format_time(result['solve_time']):>10}"
+            )
+        else:
+            message = result["status"]
+            if result.get("answer"):
+                message += f" ({result['answer']})"
+            lines.append(f"{result['day']:>3} {part:>4} {message}")
+    return "\n".join(lines)
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import tracemalloc
+
+from aoc.generators import generate
+from aoc.runner import PARTS, format_time, run_day
+
+# the 1x size of each day's generated input, roughly that of a real input
+BASE_SIZES = {
+    (2023, 1): 1000,
+    (2023, 2): 100,
+    (2023, 3): 140,
+    (2023, 4): 200,
+    (2023, 5): 30,
+    (2023, 6): 4,
+    (2023, 7): 1000,
+    (2023, 8): 200,
+}
+
+SCALES = (1, 10, 100, 1000)
+
+
+def benchmark_day(year: int, day: int, size: int, repeat=1, seed=0) -> dict:
+    """Solve a generated input of the given size, recording time and memory.
+
+    Times come from runs without tracing, and the peak traced memory from one
+    more run with tracemalloc on, since tracing slows everything down.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        with open(path, "w") as file:
+            file.write(generate(year, day, size, seed))
+
+        result = run_day(year, day, path, repeat)
+
+        tracemalloc.start()
+        try:
+            run_day(year, day, path)
+            _, result["peak_memory"] = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result["size"] = size
+        result["input_bytes"] = os.path.getsize(path)
+
+    return result
+
+
+def benchmark(year: int, days, scales=SCALES, repeat=1, seed=0):
+    """Yield a benchmark result for every day at every scale."""
+    for day in days:
+        for scale in scales:
+            result = benchmark_day(
+                year, day, BASE_SIZES[(year, day)] * scale, repeat, seed
+            )
+            result["scale"] = scale
+            yield result
+
+
+def format_bytes(n: int) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def format_header() -> str:
+    return (
+        f"{'day':>3} {'scale':>6} {'size':>8} {'input':>10} {'parse':>10}"
+        f" {'part 1':>10} {'part 2':>10} {'peak mem':>10}"
+    )
+
+
+def format_row(result: dict) -> str:
+    # the best of the repeated runs is the least noisy figure
+    times = [min(result["parse"])] + [min(result[part]["times"]) for part in PARTS]
+    return (
+        f"{result['day']:>3} {result['scale']:>5}x {result['size']:>8}"
+        f" {format_bytes(result['input_bytes']):>10}"
+        + "".join(f" {format_time(t):>10}" for t in times)
+        + f" {format_bytes(result['peak_memory']):>10}"
+    )
@@ -0,0 +1,111 @@
+"""An on-disk cache of parsed inputs, so repeated runs can skip parsing.
+
+Parsed structures are pickled into a .aoc-cache directory next to the input.
+The cache key is a hash of the input's contents together with hashes of the
+day module's source and of every aoc module it uses, so editing either the
+input or the parser (or anything else in the day's solution, or the shared
+code it builds on) rebuilds the entry automatically. The oldest
+entries are evicted once the directory grows past a size cap.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+
+CACHE_DIR = ".aoc-cache"
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def file_hash(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_files(module) -> list[str]:
+    """The module's file and those of the aoc modules it uses, directly or not."""
+    files = set()
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        if current.__file__ in files:
+            continue
+        files.add(current.__file__)
+
+        for value in vars(current).values():
+            name = value.__name__ if isinstance(value, ModuleType) else None
+            name = name or getattr(value, "__module__", None)
+            if isinstance(name, str) and name.split(".")[0] == "aoc":
+                if name in sys.modules:
+                    pending.append(sys.modules[name])
+
+    return sorted(files)
+
+
+def cache_path(module, path) -> Path:
+    sources = ":".join(file_hash(file) for file in source_files(module))
+    key = hashlib.sha256(
+        f"{module.__name__}:{sources}:{file_hash(path)}".encode()
+    ).hexdigest()
+    return Path(path).resolve().parent / CACHE_DIR / f"{key}.pickle"
+
+
+def cached_parse(module, path, max_bytes=MAX_CACHE_BYTES):
+    """Return module.parse(path), reusing a cached result when there is one."""
+    entry = cache_path(module, path)
+
+    # another process may evict the entry at any moment, in which case it is
+    # simply parsed again
+    try:
+        with open(entry, "rb") as file:
+            parsed = pickle.load(file)
+        # touching the entry keeps recently used entries from being evicted
+        os.utime(entry)
+        return parsed
+    except FileNotFoundError:
+        pass
+
+    parsed = module.parse(path)
+
+    entry.parent.mkdir(exist_ok=True)
+    # write to a temporary file of our own first, so that a half-written entry
+    # is never read and processes writing the same entry don't collide; if
+    # another process got there first its entry is just as good as ours
+    with tempfile.NamedTemporaryFile(
+        dir=entry.parent, suffix=".partial", delete=False
+    ) as file:
+        pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        os.replace(file.name, entry)
+    except OSError:
+        Path(file.name).unlink(missing_ok=True)
+
+    evict(entry.parent, max_bytes)
+
+    return parsed
+
+
+def evict(directory: Path, max_bytes=MAX_CACHE_BYTES):
+    """Delete the least recently used entries until the cache fits in max_bytes."""
+    entries = []
+    for entry in directory.glob("*.pickle"):
+        try:
+            entries.append((entry.stat(), entry))
+        except FileNotFoundError:
+            # already evicted by another process
+            pass
+    entries.sort(key=lambda e: e[0].st_mtime)
+    total = sum(stat.st_size for stat, _ in entries)
+
+    # the newest entry is always kept, even when it is over the cap on its own
+    for stat, entry in entries[:-1]:
+        if total <= max_bytes:
+            break
+        total -= stat.st_size
+        entry.unlink(missing_ok=True)
@@ -0,0 +1,177 @@
+"""Synthetic puzzle inputs of any size, for benchmarking the solutions.
+
+Each generator takes a size (the number of lines, games, rows, cards, map
+entries, races, hands or nodes) and a random.Random, and returns the text of a
+valid input in the same format as the real puzzle.
+"""
+
+import random
+import string
+from itertools import product
+
+SPELLED_DIGITS = [
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+
+
+def day1(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        words = [
+            rng.choice(
+                [
+                    rng.choice(SPELLED_DIGITS),
+                    rng.choice(string.digits[1:]),
+                    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))),
+                ]
+            )
+            for _ in range(rng.randint(2, 8))
+        ]
+        # every line needs at least one numeral for part 1
+        words.insert(rng.randrange(len(words) + 1), rng.choice(string.digits[1:]))
+        lines.append("".join(words))
+    return "\n".join(lines) + "\n"
+
+
+def day2(size: int, rng: random.Random) -> str:
+    lines = []
+    for id in range(1, size + 1):
+        reveals = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            reveals.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+        lines.append(f"Game {id}: {'; '.join(reveals)}")
+    return "\n".join(lines) + "\n"
+
+
+def day3(size: int, rng: random.Random, width: int = 140) -> str:
+    lines = []
+    for _ in range(size):
+        row = []
+        while len(row) < width:
+            roll = rng.random()
+            if roll < 0.15:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif roll < 0.2:
+                row.append(rng.choice("*#+$/=%@&-"))
+            else:
+                row.append(".")
+        lines.append("".join(row[:width]))
+    return "\n".join(lines) + "\n"
+
+
+# how often a card has 0, 1, 2, ... matches; most have none or a few, and the
+# average is under one so that the copies won stay in proportion to the
+# number of cards rather than growing exponentially with it
+MATCH_WEIGHTS = [66, 13, 8, 4, 3, 2, 1, 1, 1, 1, 0]
+
+
+def day4(size: int, rng: random.Random, winning: int = 10, player: int = 25) -> str:
+    lines = []
+    for id in range(1, size + 1):
+        # cards near the end can't win copies of cards that don't exist
+        weights = MATCH_WEIGHTS[: winning + 1]
+        matches = min(rng.choices(range(len(weights)), weights)[0], size - id)
+        winning_numbers = rng.sample(range(1, 100), winning)
+        others = [n for n in range(1, 100) if n not in winning_numbers]
+        player_numbers = winning_numbers[:matches] + rng.sample(
+            others, player - matches
+        )
+        rng.shuffle(player_numbers)
+        lines.append(
+            f"Card {id:>3}: {' '.join(f'{n:>2}' for n in winning_numbers)} | "
+            f"{' '.join(f'{n:>2}' for n in player_numbers)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def day5(size: int, rng: random.Random, seed_pairs: int = 10) -> str:
+    limit = 2**32
+    seeds = []
+    for _ in range(seed_pairs):
+        start = rng.randrange(limit // 2)
+        seeds.extend([start, rng.randint(1, limit // (4 * seed_pairs))])
+
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    names = ["seed", "soil", "fertilizer", "water", "light", "temperature"]
+    names += ["humidity", "location"]
+    for source, destination in zip(names, names[1:]):
+        # non-overlapping source ranges, each sent somewhere random
+        bounds = sorted(rng.sample(range(limit), 2 * size))
+        entries = [
+            f"{rng.randrange(limit - (end - start))} {start} {end - start}"
+            for start, end in zip(bounds[::2], bounds[1::2])
+        ]
+        rng.shuffle(entries)
+        sections.append(f"{source}-to-{destination} map:\n" + "\n".join(entries))
+
+    return "\n\n".join(sections) + "\n"
+
+
+def day6(size: int, rng: random.Random) -> str:
+    times = [rng.randint(7, 99) for _ in range(size)]
+    # every record is beatable but not by every hold time
+    distances = [rng.randint(time, time * time // 4 - 1) for time in times]
+    return (
+        f"Time:      {'  '.join(f'{t:>4}' for t in times)}\n"
+        f"Distance:  {'  '.join(f'{d:>4}' for d in distances)}\n"
+    )
+
+
+def day7(size: int, rng: random.Random) -> str:
+    # there are only 13**5 different hands, so large inputs repeat some of them
+    hands = ("".join(rng.choices("23456789TJQKA", k=5)) for _ in range(size))
+    return "".join(f"{hand} {rng.randint(1, 1000)}\n" for hand in hands)
+
+
+def day8(size: int, rng: random.Random, ghosts: int = 6) -> str:
+    # each ghost steps off its A node onto a loop whose last node is its Z
+    # node; the loops are prime multiples of the instruction length so that
+    # all the ghosts meet, AoC style, at the lcm of the loop lengths
+    primes = [3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47][:ghosts]
+    period = max(1, (size - ghosts) // (2 * sum(primes)))
+    instructions = "".join(rng.choices("LR", k=period))
+
+    alphabet = string.digits + string.ascii_letters
+    names = ("".join(name) for name in product(alphabet, repeat=3))
+    filler = (name for name in names if name[-1] not in "AZ")
+
+    nodes = {}
+    for g, prime in enumerate(primes):
+        start, end = ("AAA", "ZZZ") if g == 0 else (f"{g:02d}A", f"{g:02d}Z")
+        loop = [next(filler) for _ in range(prime * period - 1)] + [end]
+        nodes[start] = (loop[0], loop[0])
+        for node, following in zip(loop, loop[1:] + loop[:1]):
+            nodes[node] = (following, following)
+
+    fillers = [next(filler) for _ in range(max(size - len(nodes), 1))]
+    for node in fillers:
+        nodes[node] = (rng.choice(fillers), rng.choice(fillers))
+
+    network = "\n".join(f"{n} = ({l}, {r})" for n, (l, r) in nodes.items())
+    return f"{instructions}\n\n{network}\n"
+
+
+GENERATORS = {
+    (2023, 1): day1,
+    (2023, 2): day2,
+    (2023, 3): day3,
+    (2023, 4): day4,
+    (2023, 5): day5,
+    (2023, 6): day6,
+    (2023, 7): day7,
+    (2023, 8): day8,
+}
+
+
+def generate(year: int, day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[(year, day)](size, random.Random(seed))
@@ -0,0 +1,104 @@
+import numpy as np
+
+# offsets of the 3x3 neighbourhood of a cell, the cell itself included
+NEIGHBOURHOOD = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)]
+
+
+class Grid:
+    """A rectangular character grid held as a 2-D uint8 array."""
+
+    def __init__(self, cells: np.ndarray):
+        self.cells = cells
+
+    @classmethod
+    def from_lines(cls, lines):
+        lines = [line.encode() if isinstance(line, str) else line for line in lines]
+        width = max((len(line) for line in lines), default=0)
+        # short lines are padded out with spaces so that rows line up
+        data = b"".join(line.ljust(width) for line in lines)
+        return cls(np.frombuffer(data, np.uint8).reshape(len(lines), width).copy())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            return cls.from_lines(file.read().splitlines())
+
+    @property
+    def shape(self):
+        return self.cells.shape
+
+    def mask(self, chars) -> np.ndarray:
+        """Boolean mask of the cells holding any of chars."""
+        chars = chars.encode() if isinstance(chars, str) else chars
+        return np.isin(self.cells, np.frombuffer(chars, np.uint8))
+
+    def digits(self) -> np.ndarray:
+        return (self.cells >= ord("0")) & (self.cells <= ord("9"))
+
+    def symbols(self, blank=".") -> np.ndarray:
+        """Mask of everything that is neither a digit nor blank."""
+        return ~self.digits() & ~self.mask(blank) & ~self.mask(" ")
+
+
+def shift(array: np.ndarray, di: int, dj: int, fill=0) -> np.ndarray:
+    """Return array moved so that out[i, j] = array[i + di, j + dj]."""
+    height, width = array.shape
+    out = np.full_like(array, fill)
+    out[max(-di, 0) : height - max(di, 0), max(-dj, 0) : width - max(dj, 0)] = array[
+        max(di, 0) : height + min(di, 0), max(dj, 0) : width + min(dj, 0)
+    ]
+    return out
+
+
+def dilate(mask: np.ndarray) -> np.ndarray:
+    """Grow a mask by one cell in all eight directions."""
+    grown = mask.copy()
+    for di, dj in NEIGHBOURHOOD:
+        grown |= shift(mask, di, dj, False)
+    return grown
+
+
+def label_runs(mask: np.ndarray) -> tuple[np.ndarray, int]:
+    """Label every horizontal run of True cells 1, 2, ... in reading order.
+
+    Cells outside the mask are labelled 0. Returns the labels and the number
+    of runs.
+    """
+    starts = mask & ~shift(mask, 0, -1, False)
+    labels = np.cumsum(starts.ravel()).reshape(mask.shape) * mask
+    return labels, int(starts.sum())
+
+
+def run_values(grid: Grid, labels: np.ndarray, count: int) -> np.ndarray:
+    """Read each labelled run of digits as a number, indexed by label.
+
+    Index 0 (the background) is always 0.
+    """
+    flat = labels.ravel()
+    cells = np.flatnonzero(flat)
+    run = flat[cells]
+
+    # the last cell of each run is the units column; cells come in reading
+    # order, so a run ends wherever the next cell has another label
+    ends = run != np.append(run[1:], 0)
+    last = np.zeros(count + 1, np.int64)
+    last[run[ends]] = cells[ends]
+    powers = 10 ** (last[run] - cells)
+
+    values = np.zeros(count + 1, np.int64)
+    np.add.at(values, run, (grid.cells.ravel()[cells] - ord("0")) * powers)
+    return values
+
+
+def neighbourhoods(array: np.ndarray, mask: np.ndarray, fill=0) -> np.ndarray:
+    """Gather the 3x3 neighbourhood of every True cell of mask.
+
+    Returns an (n, 9) array with one row per masked cell in reading order.
+    """
+    return np.stack([shift(array, di, dj, fill)[mask] for di, dj in NEIGHBOURHOOD], 1)
+
+
+def gather_labels(labels: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """The distinct non-zero labels that fall inside mask."""
+    found = np.unique(labels[mask])
+    return found[found > 0]
@@ -0,0 +1,102 @@
+"""Opt-in profiling of a day's parse and solve phases.
+
+Each phase runs under cProfile and tracemalloc, and the report is plain JSON
+(hot functions, peak traced memory and the memory each phase left allocated)
+so that reports from different runs can be diffed.
+"""
+
+import cProfile
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+
+from aoc.runner import PARTS, ROOT, input_path, load_day
+
+
+def location(filename: str, line: int, name=None) -> str:
+    # paths inside the repository are made relative so reports diff cleanly
+    # between checkouts
+    try:
+        filename = str(Path(filename).resolve().relative_to(ROOT))
+    except ValueError:
+        pass
+    return f"{filename}:{line}" + (f"({name})" if name else "")
+
+
+def profile_phase(function, *args, top=15) -> tuple[object, dict]:
+    """Call function under cProfile and tracemalloc and report on the call."""
+    profiler = cProfile.Profile()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+
+    profiler.enable()
+    try:
+        result = function(*args)
+    finally:
+        profiler.disable()
+
+    wall_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    # the allocations still alive at the end of the phase, by where they
+    # happened, leaving out those made by the instrumentation itself
+    after = after.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    # (tracemalloc only sees what is allocated at the two snapshots, so
+    # anything freed again within the phase shows up in the peak alone)
+    live = [stat for stat in after.compare_to(before, "lineno") if stat.count_diff > 0]
+
+    stats = pstats.Stats(profiler).stats
+    hot = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+
+    report = {
+        "wall_time": wall_time,
+        "peak_memory": peak,
+        "live_blocks": sum(stat.count_diff for stat in live),
+        "live_bytes": sum(stat.size_diff for stat in live),
+        "hot_functions": [
+            {
+                "function": location(*key),
+                "calls": calls,
+                "primitive_calls": primitive_calls,
+                "tottime": tottime,
+                "cumtime": cumtime,
+            }
+            for key, (primitive_calls, calls, tottime, cumtime, _) in hot
+        ],
+        "top_live_allocations": [
+            {
+                "location": location(
+                    stat.traceback[0].filename, stat.traceback[0].lineno
+                ),
+                "blocks": stat.count_diff,
+                "bytes": stat.size_diff,
+            }
+            for stat in sorted(live, key=lambda s: s.size_diff, reverse=True)[:top]
+        ],
+    }
+
+    return result, report
+
+
+def profile_day(year: int, day: int, path=None, top=15) -> dict:
+    module = load_day(year, day)
+    path = str(path or input_path(year, day))
+
+    parsed, parse_report = profile_phase(module.parse, path, top=top)
+    report = {"year": year, "day": day, "input": path, "parse": parse_report}
+
+    for part in PARTS:
+        answer, part_report = profile_phase(getattr(module, part), parsed, top=top)
+        report[part] = {"answer": answer, **part_report}
+
+    return report
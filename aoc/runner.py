@@ -0,0 +1,137 @@
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from statistics import mean
+
+from aoc.cache import MAX_CACHE_BYTES, cached_parse
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PARTS = ("part1", "part2")
+
+
+def day_path(year: int, day: int) -> Path:
+    return ROOT / str(year) / str(day) / f"{day}.py"
+
+
+def input_path(year: int, day: int) -> Path:
+    return day_path(year, day).with_name("input.txt")
+
+
+def available_days(year: int) -> list[int]:
+    return sorted(
+        int(path.name)
+        for path in (ROOT / str(year)).iterdir()
+        if path.name.isdigit() and (path / f"{path.name}.py").exists()
+    )
+
+
+def load_day(year: int, day: int):
+    """Import a day's solution module from its file.
+
+    Day modules expose parse(path), part1(parsed) and part2(parsed) and have
+    no side effects on import. The module is registered in sys.modules so
+    that its functions can be pickled into worker processes.
+    """
+    name = f"aoc_{year}_{day}"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, day_path(year, day))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+def timed(function, *args, repeat=1):
+    """Call function repeat times, returning the last result and every wall time."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+    return result, times
+
+
+def run_day(
+    year: int, day: int, path=None, repeat=1, cache=False, cache_bytes=MAX_CACHE_BYTES
+) -> dict:
+    """Parse a day's input and solve both parts, timing each phase separately.
+
+    With cache set the parsed input is loaded from (or saved to) the parse
+    cache, and the parse time is the time taken to do that.
+    """
+    module = load_day(year, day)
+    path = str(path or input_path(year, day))
+
+    if cache:
+        parse = lambda path: cached_parse(module, path, cache_bytes)
+    else:
+        parse = module.parse
+
+    parsed, parse_times = timed(parse, path, repeat=repeat)
+    result = {"year": year, "day": day, "input": path, "parse": parse_times}
+
+    for part in PARTS:
+        answer, times = timed(getattr(module, part), parsed, repeat=repeat)
+        result[part] = {"answer": answer, "times": times}
+
+    return result
+
+
+def stream_day(year: int, day: int, path=None) -> dict:
+    """Solve both parts of a day in one pass over its input, a line at a time.
+
+    Only days whose module exposes stream(lines) can be run this way. A path
+    of "-" reads the input from stdin, so it never has to be saved to disk.
+    """
+    module = load_day(year, day)
+    if not hasattr(module, "stream"):
+        raise ValueError(f"{year} Day {day} has no streaming mode")
+    path = str(path or input_path(year, day))
+
+    if path == "-":
+        answers, times = timed(module.stream, sys.stdin)
+    else:
+        with open(path, "r") as file:
+            answers, times = timed(module.stream, file)
+
+    return {"year": year, "day": day, "input": path, "answers": answers, "times": times}
+
+
+def format_stream_result(result: dict) -> str:
+    lines = [f"{result['year']} Day {result['day']} (streamed)"]
+    for n, answer in enumerate(result["answers"], 1):
+        lines.append(f"  part {n}  {answer}")
+    lines.append(f"  total   {'':<20} {format_times(result['times'])}")
+    return "\n".join(lines)
+
+
+def format_time(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def format_times(times: list[float]) -> str:
+    if len(times) == 1:
+        return format_time(times[0])
+    return (
+        f"best {format_time(min(times))}, mean {format_time(mean(times))}"
+        f" over {len(times)} runs"
+    )
+
+
+def format_result(result: dict) -> str:
+    lines = [
+        f"{result['year']} Day {result['day']}",
+        f"  parse   {'':<20} {format_times(result['parse'])}",
+    ]
+    for n, part in enumerate(PARTS, 1):
+        answer = result[part]["answer"]
+        lines.append(
+            f"  part {n}  {answer!s:<20} {format_times(result[part]['times'])}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,2 @@
+# Having a conftest.py at the root puts the root on sys.path under pytest, so
+# that the day modules and their tests can import the aoc package.